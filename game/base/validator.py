@@ -28,6 +28,7 @@ import argparse
 import threading
 import subprocess
 from datetime import datetime, timezone
+import aiohttp
 import bittensor as bt
 import wandb
 
@@ -51,6 +52,16 @@ from dotenv import load_dotenv
 load_dotenv()  # take environment variables from .env.
 
 
+# How long a signed backend header set may be reused; kept short so the signed
+# timestamp is always fresh by the time the backend checks it.
+SIGNED_HEADERS_REUSE_SECONDS = 5
+
+
+def _compact_json_dumps(obj) -> str:
+    """Serialise request bodies without the whitespace ``json.dumps`` adds."""
+    return json.dumps(obj, separators=(",", ":"))
+
+
 class BaseValidatorNeuron(BaseNeuron):
     """
     Base class for Bittensor validators. Your validator should inherit from this class.
@@ -88,6 +99,8 @@ class BaseValidatorNeuron(BaseNeuron):
         self.thread: Union[threading.Thread, None] = None
         self.competition_processes: dict[str, subprocess.Popen] = {}
         self.game_plugin = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._signed_headers_cache: Optional[tuple] = None
 
     @staticmethod
     def _competition_codes_for_main() -> list[str]:
@@ -151,6 +164,32 @@ class BaseValidatorNeuron(BaseNeuron):
             bt.logging.error(f"Failed to create Axon initialize with exception: {e}")
             pass
 
+    async def get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        The session lives on ``self.loop`` for the validator's lifetime so
+        backend calls (active miners, room create/update/remove) can reuse
+        pooled connections instead of re-handshaking.
+        """
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                # Miner turns can take over a minute, so keep idle backend
+                # connections around well past aiohttp's 15s default.
+                connector=aiohttp.TCPConnector(
+                    limit=64, ttl_dns_cache=600, keepalive_timeout=75
+                ),
+                json_serialize=_compact_json_dumps,
+            )
+        return self._http_session
+
+    def close_http_session(self) -> None:
+        """Close the shared HTTP session if the event loop is idle."""
+        session = self._http_session
+        if session is None or session.closed or self.loop.is_running():
+            return
+        self._http_session = None
+        self.loop.run_until_complete(session.close())
+
     async def concurrent_forward(self):
         coroutines = [
             self.forward() for _ in range(self.config.neuron.num_concurrent_forwards)
@@ -300,6 +339,7 @@ class BaseValidatorNeuron(BaseNeuron):
             backend_url=scores_endpoint,
             fetch_url=scores_fetch_endpoint,
             signer=self.build_signed_headers,
+            session_factory=self.get_http_session,
         )
         self.score_store.init()
         self.generic_store = GenericStore(scores_db_path)
@@ -453,6 +493,7 @@ class BaseValidatorNeuron(BaseNeuron):
             # If someone intentionally stops the validator, it'll safely terminate operations.
             except KeyboardInterrupt:
                 self.axon.stop()
+                self.close_http_session()
                 bt.logging.success("Validator killed by keyboard interrupt.")
                 for wandb_run in self.wandb_runs.values():
                     if wandb_run:
@@ -517,20 +558,38 @@ class BaseValidatorNeuron(BaseNeuron):
                 self.should_exit = True
                 self.thread.join(5)
                 self.is_running = False
+                self.close_http_session()
                 self.score_store.close()
                 bt.logging.debug("Stopped")
 
     def build_signed_headers(self) -> dict:
         timestamp = int(datetime.now(tz=timezone.utc).timestamp())
+        game_code = self.game.value or "codenames"
+        competition_code = self.competition.value
+        # The signature only covers the timestamp, so back-to-back backend
+        # calls can share one for a few seconds instead of re-signing each time.
+        cached = self._signed_headers_cache
+        if (
+            cached is not None
+            and 0 <= timestamp - cached[0] < SIGNED_HEADERS_REUSE_SECONDS
+            and cached[1] == (game_code, competition_code)
+        ):
+            return dict(cached[2])
         message = f"<Bytes>{timestamp}</Bytes>"
         signature = self.wallet.hotkey.sign(message)
-        return {
+        headers = {
             "X-Validator-Hotkey": self.wallet.hotkey.ss58_address,
             "X-Validator-Signature": signature.hex(),
             "X-Validator-Timestamp": str(timestamp),
-            "x-game-code": self.game.value or "codenames",
-            "x-competition-code": self.competition.value,
+            "x-game-code": game_code,
+            "x-competition-code": competition_code,
         }
+        self._signed_headers_cache = (
+            timestamp,
+            (game_code, competition_code),
+            headers,
+        )
+        return dict(headers)
 
     def __enter__(self):
         self.run_in_background_thread()
@@ -557,6 +616,7 @@ class BaseValidatorNeuron(BaseNeuron):
             if self.thread:
                 self.thread.join(5)
             self.is_running = False
+            self.close_http_session()
             bt.logging.debug("Stopped")
 
     def set_weights(self):
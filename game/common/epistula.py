@@ -8,20 +8,32 @@ import time
 import httpx
 from bittensor_wallet.keypair import Keypair
 
+# Hash of an empty request body, used by GET-style calls that sign b"".
+EMPTY_BODY_HASH = sha256(b"").hexdigest()
+
 
 def generate_header(
     hotkey: Keypair,
     body: Any,
     signed_for: Optional[str] = None,
 ) -> Dict[str, Any]:
-    timestamp = round(time.time() * 1000)
-    timestampInterval = ceil(timestamp / 1e4) * 1e4
-    uuid = str(uuid4())
     req_hash = None
     if isinstance(body, bytes):
-        req_hash = sha256(body).hexdigest()
+        req_hash = EMPTY_BODY_HASH if not body else sha256(body).hexdigest()
     else:
         req_hash = sha256(json.dumps(body).encode("utf-8")).hexdigest()
+    return generate_header_prehashed(hotkey, req_hash, signed_for)
+
+
+def generate_header_prehashed(
+    hotkey: Keypair,
+    req_hash: str,
+    signed_for: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build Epistula headers for a body whose sha256 hexdigest is already known."""
+    timestamp = round(time.time() * 1000)
+    timestampInterval = ceil(timestamp / 1e4) * 1e4
+    uuid = str(uuid4())
 
     headers = {
         "Epistula-Version": str(2),
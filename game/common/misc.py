@@ -19,7 +19,7 @@
 from datetime import datetime
 import time
 from math import floor
-from typing import Callable, Any
+from typing import Callable, Any, Tuple
 from functools import lru_cache, update_wrapper
 from json_repair import repair_json
 import json
@@ -113,6 +113,21 @@ def ttl_get_block(self) -> int:
     return self.subtensor.get_current_block()
 
 
+# Half a block: the epoch position cannot move by more than one step.
+@ttl_cache(maxsize=1, ttl=6)
+def ttl_get_epoch_info(self) -> Tuple[int, float]:
+    """
+    Retrieves ``(blocks_since_epoch, chain_timestamp)`` for the validator's subnet, cached for 6 seconds
+    so back-to-back callers share the two subtensor round-trips.
+
+    Note: self here is the miner or validator instance
+    """
+    blocks_since_epoch = self.subtensor.get_subnet_info(
+        self.config.netuid
+    ).blocks_since_epoch
+    return blocks_since_epoch, self.subtensor.get_timestamp().timestamp()
+
+
 def parse_ts(value):
     if value is None:
         return 0
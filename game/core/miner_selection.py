@@ -1,9 +1,12 @@
+import asyncio
 import random
-import aiohttp
+from collections import Counter
 import bittensor as bt
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 
+from game.common.logging import debug_enabled
+from game.common.misc import ttl_get_epoch_info
 from game.plugins.codenames.game_types import Competition
 from game.core.commitment_reader import read_endpoints
 from game.providers.targon_client import check_endpoints, get_metadata
@@ -13,132 +16,99 @@ def _log_yellow_info(message: str) -> None:
     bt.logging.info(f"\033[33m{message}\033[0m")
 
 
-def make_available_pool(self, exclude: List[int] = None) -> List[int]:
-    """Build the candidate uid pool, removing excluded miners"""
-    available_pool = [int(uid) for uid in self.metagraph.uids]
-    # Step 1: Exclude uids in the exclude list
-    available_pool = [uid for uid in available_pool if uid not in (exclude or [])]
-    if not available_pool:
-        return []
-    # Step 2: Choose uids which have minimum global game count in current epoch
-    minimum_global_count = min(
-        [
-            self._global_counts_in_epoch.get(self.metagraph.hotkeys[uid], 0)
-            for uid in available_pool
-        ]
-    )
-    available_pool = [
-        uid
-        for uid in available_pool
-        if self._global_counts_in_epoch.get(self.metagraph.hotkeys[uid], 0)
-        == minimum_global_count
-    ]
-    bt.logging.debug(
-        f"Available pool after exclusions: {available_pool}, counts: {[self._global_counts_in_epoch.get(self.metagraph.hotkeys[uid], 0) for uid in available_pool]}"
-    )
-    if not available_pool:
-        return []
-    # Step 3: Choose uids which have minimum local game count in current window
-    minimum_local_count = min(
-        [
-            self._local_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-            for uid in available_pool
-        ]
+def _counts_by_uid(hotkeys: List[str], counts: Dict[str, int]) -> np.ndarray:
+    """Lay out per-hotkey game counts as an array indexed by uid."""
+    return np.fromiter(
+        (counts.get(hotkey, 0) for hotkey in hotkeys),
+        dtype=np.int64,
+        count=len(hotkeys),
     )
-    available_pool = [
-        uid
-        for uid in available_pool
-        if self._local_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-        == minimum_local_count
-    ]
-    bt.logging.debug(
-        f"Available pool after local count filter: {available_pool}, counts: {[self._local_counts_in_window.get(self.metagraph.hotkeys[uid], 0) for uid in available_pool]}"
-    )
-    # Step 4: Choose uids which have minimum global game count in current window
-    minimum_global_count = min(
-        [
-            self._global_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-            for uid in available_pool
-        ]
-    )
-    available_pool = [
-        uid
-        for uid in available_pool
-        if self._global_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-        == minimum_global_count
-    ]
-    bt.logging.debug(
-        f"Available pool after global count filter: {available_pool}, counts: {[self._global_counts_in_window.get(self.metagraph.hotkeys[uid], 0) for uid in available_pool]}"
-    )
-    # Step 5: Shuffle the available pool
-    random.shuffle(available_pool)
-
-    return available_pool
 
 
-def make_available_pool_for_second_player(self, exclude: List[int] = None) -> List[int]:
-    """Build the candidate uid pool, removing excluded miners"""
-    available_pool = [int(uid) for uid in self.metagraph.uids]
-    # Step 1: Exclude uids in the exclude list
-    available_pool = [uid for uid in available_pool if uid not in (exclude or [])]
-    if not available_pool:
+def _uid_mask(size: int, uids: Iterable[int]) -> np.ndarray:
+    """Return a boolean array of ``size`` with the given uids set."""
+    mask = np.zeros(size, dtype=bool)
+    mask[list(uids)] = True
+    return mask
+
+
+def _keep_lexmin(idx: np.ndarray, *counts: np.ndarray) -> np.ndarray:
+    """Narrow ``idx`` to the entries tied at the smallest tuple of counts.
+
+    Counts are compared lexicographically, so this is the same as keeping the
+    minimum of each count in turn, but done in a single pass over ``idx``.
+    """
+    keys = np.stack([c[idx] for c in counts])
+    best = keys[:, np.lexsort(keys[::-1])[0]]
+    return idx[(keys == best[:, None]).all(axis=0)]
+
+
+def _median(values: np.ndarray) -> float:
+    """Median via a single partial partition of ``values``."""
+    half = values.size // 2
+    if values.size % 2:
+        return float(np.partition(values, half)[half])
+    lower, upper = np.partition(values, (half - 1, half))[half - 1 : half + 1]
+    return (lower + upper) / 2.0
+
+
+def _random_order(pool: List[int]) -> Iterator[int]:
+    """Yield the items of ``pool`` in random order, consuming the list.
+
+    Each draw is a swap-and-pop, so a caller that stops after the first few
+    accepted uids does not pay for shuffling the whole pool.
+    """
+    while pool:
+        i = random.randrange(len(pool))
+        pool[i], pool[-1] = pool[-1], pool[i]
+        yield pool.pop()
+
+
+def make_available_pool(
+    uids: np.ndarray,
+    exclude_mask: np.ndarray,
+    epoch_counts: np.ndarray,
+    local_counts: np.ndarray,
+    global_counts: np.ndarray,
+    *,
+    second_player: bool = False,
+) -> List[int]:
+    """Build the candidate uid pool, removing excluded miners.
+
+    The second player is drawn more loosely: instead of the minimum window
+    count tier, anyone not far above the median window count qualifies.
+    """
+    debug = debug_enabled()
+    # Step 1: Exclude uids in the exclude mask
+    idx = np.flatnonzero(~exclude_mask)
+    if idx.size == 0:
         return []
-    # Step 2: Choose uids which have minimum global game count in current epoch
-    minimum_global_count = min(
-        [
-            self._global_counts_in_epoch.get(self.metagraph.hotkeys[uid], 0)
-            for uid in available_pool
-        ]
-    )
-    available_pool = [
-        uid
-        for uid in available_pool
-        if self._global_counts_in_epoch.get(self.metagraph.hotkeys[uid], 0)
-        == minimum_global_count
-    ]
-    bt.logging.debug(
-        f"Available pool after exclusions: {available_pool}, counts: {[self._global_counts_in_epoch.get(self.metagraph.hotkeys[uid], 0) for uid in available_pool]}"
-    )
-    if not available_pool:
-        return []
-    # Step 3: Choose uids which have minimum local game count in current window
-    minimum_local_count = min(
-        [
-            self._local_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-            for uid in available_pool
-        ]
-    )
-    available_pool = [
-        uid
-        for uid in available_pool
-        if self._local_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-        == minimum_local_count
-    ]
-    bt.logging.debug(
-        f"Available pool after local count filter: {available_pool}, counts: {[self._local_counts_in_window.get(self.metagraph.hotkeys[uid], 0) for uid in available_pool]}"
-    )
-
-    # Step 4: Filter out uids which played too many games in current window
-    median_count = np.median(
-        [
-            self._global_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-            for uid in available_pool
-        ]
-    )
-    available_pool = [
-        uid
-        for uid in available_pool
-        if self._global_counts_in_window.get(self.metagraph.hotkeys[uid], 0)
-        < median_count + 3
-    ]
-    random.shuffle(available_pool)
-
-    return available_pool
+    if second_player:
+        # Step 2: Choose uids which have minimum global game count in current
+        # epoch, then minimum local game count in current window
+        idx = _keep_lexmin(idx, epoch_counts, local_counts)
+        # Step 3: Filter out uids which played too many games in current window
+        candidate_counts = global_counts[idx]
+        median_count = _median(candidate_counts)
+        idx = idx[candidate_counts < median_count + 3]
+    else:
+        # Step 2: Choose uids which have minimum global game count in current
+        # epoch, then minimum local and global game count in current window
+        idx = _keep_lexmin(idx, epoch_counts, local_counts, global_counts)
+    if debug:
+        bt.logging.debug(
+            f"Available pool after count filters: {uids[idx].tolist()}, "
+            f"epoch counts: {epoch_counts[idx].tolist()}, "
+            f"local counts: {local_counts[idx].tolist()}, "
+            f"global counts: {global_counts[idx].tolist()}"
+        )
+    # Callers draw from the pool in random order via _random_order
+    return uids[idx].tolist()
 
 
 async def fetch_active_miners(self, competition: Competition):
-    session = aiohttp.ClientSession()
     try:
+        session = await self.get_http_session()
         headers = self.build_signed_headers()
         params = {"competition": competition.value}
         async with session.get(
@@ -158,8 +128,39 @@ async def fetch_active_miners(self, competition: Competition):
     except Exception as err:  # noqa: BLE001
         bt.logging.error(f"Exception fetching active miners: {err}")
         return []
-    finally:
-        await session.close()
+
+
+async def _fetch_window_counts(self, competition: Competition):
+    """Read local/global game counts for the scoring window and current epoch.
+
+    The subtensor client is not thread-safe, so the chain lookup stays on the
+    loop thread and only the score store scan runs in a worker thread.
+
+    Returns ``None`` if the chain or the score store could not be read.
+    """
+    try:
+        blocks_since_epoch, chain_ts = ttl_get_epoch_info(self)
+        end_ts = int(chain_ts + (360 - blocks_since_epoch) * 12)
+        since_ts = end_ts - int(self.scoring_window_seconds)
+        # One scan of the score store covers both the scoring window and epoch.
+        (
+            (local_counts_in_window, global_counts_in_window),
+            (local_counts_in_epoch, global_counts_in_epoch),
+        ) = await asyncio.to_thread(
+            self.score_store.records_in_ranges,
+            self.wallet.hotkey.ss58_address,
+            competition.value,
+            [(since_ts, end_ts), (end_ts - (360 * 12), end_ts)],
+        )
+    except Exception as err:  # noqa: BLE001
+        bt.logging.error(f"Failed to fetch window scores: {err}")
+        return None
+    return (
+        local_counts_in_window,
+        global_counts_in_window,
+        local_counts_in_epoch,
+        global_counts_in_epoch,
+    )
 
 
 async def choose_players(
@@ -167,127 +168,116 @@ async def choose_players(
     competition: Competition,
     k: int = 2,
     exclude: List[int] = None,
-) -> Tuple[List[int], List[str]]:
+) -> Tuple[List[int], List[str], Dict[int, dict]]:
     """Returns up to ``k`` available uids for the provided competition."""
 
-    exclude_set = {int(uid) for uid in (exclude or [])}
-    exclude_set.update(
-        int(uid)
-        for uid in self.metagraph.uids
-        if self.metagraph.S[uid] < self.config.neuron.minimum_stake_requirement
-        or self.metagraph.S[uid] > self.config.blacklist.minimum_stake_requirement
+    hotkeys = self.metagraph.hotkeys
+    uids = np.asarray(self.metagraph.uids, dtype=np.int64)
+    exclude_mask = _uid_mask(len(hotkeys), (int(uid) for uid in (exclude or [])))
+    stake = np.asarray(self.metagraph.S)
+    exclude_mask |= (stake < self.config.neuron.minimum_stake_requirement) | (
+        stake > self.config.blacklist.minimum_stake_requirement
     )
-    uids_to_ping = [int(uid) for uid in self.metagraph.uids if int(uid) not in exclude_set]
+    uids_to_ping = uids[~exclude_mask].tolist()
     bt.logging.info(f"Uids to ping: {uids_to_ping}")
+    if not uids_to_ping:
+        return [], [], {}
     targon_endpoints = read_endpoints(self, competition, uids_to_ping)
     bt.logging.info(f"Targon endpoints to ping: {targon_endpoints}")
+    if not targon_endpoints:
+        return [], [], {}
 
-    responsive_uids = await check_endpoints(self, targon_endpoints, timeout=30)
+    # Endpoint probing, the score store reads and the active miner lookup are
+    # independent, so overlap the network waits with the blocking DB work.
+    responsive_uids, window_counts, active_miners = await asyncio.gather(
+        check_endpoints(self, targon_endpoints, timeout=30),
+        _fetch_window_counts(self, competition),
+        fetch_active_miners(self, competition),
+    )
     bt.logging.info(f"Responsive UIDs: {responsive_uids}")
-
-    window_seconds = self.scoring_window_seconds
-    self._local_counts_in_window = {}
-    self._global_counts_in_window = {}
-    try:
-        blocks_since_epoch = self.subtensor.get_subnet_info(
-            self.config.netuid
-        ).blocks_since_epoch
-        end_ts = int(
-            self.subtensor.get_timestamp().timestamp() + (360 - blocks_since_epoch) * 12
-        )
-        since_ts = end_ts - int(window_seconds)
-        self._local_counts_in_window, self._global_counts_in_window = (
-            self.score_store.records_in_window(
-                self.wallet.hotkey.ss58_address, competition.value, since_ts, end_ts
-            )
-        )
-        self._local_counts_in_epoch, self._global_counts_in_epoch = (
-            self.score_store.records_in_window(
-                self.wallet.hotkey.ss58_address,
-                competition.value,
-                (end_ts - (360 * 12)),
-                end_ts,
-            )
-        )
-    except Exception as err:  # noqa: BLE001
-        bt.logging.error(f"Failed to fetch window scores: {err}")
-        return [], []
-    # Get active miners
-    active_miners = await fetch_active_miners(self, competition)
-    # Increase _global_counts_in_epoch, _global_counts_in_window for active miners
-    self._global_counts_in_epoch = {
-        hotkey: count + active_miners.count(hotkey)
-        for hotkey, count in self._global_counts_in_epoch.items()
-    }
-    self._global_counts_in_window = {
-        hotkey: count + active_miners.count(hotkey)
-        for hotkey, count in self._global_counts_in_window.items()
-    }
-    available_pool = make_available_pool(self, list(exclude_set))
+    if not responsive_uids or window_counts is None:
+        return [], [], {}
+    local_counts_in_window, global_counts_in_window, _, global_counts_in_epoch = (
+        window_counts
+    )
+    # Count games the active miners are playing right now towards both globals,
+    # but only for miners that already have stored games in that range.
+    active_counts = _counts_by_uid(hotkeys, Counter(active_miners))
+    epoch_counts = _counts_by_uid(hotkeys, global_counts_in_epoch)
+    epoch_counts += np.where(epoch_counts > 0, active_counts, 0)
+    local_counts = _counts_by_uid(hotkeys, local_counts_in_window)
+    global_counts = _counts_by_uid(hotkeys, global_counts_in_window)
+    global_counts += np.where(global_counts > 0, active_counts, 0)
+    responsive_mask = _uid_mask(len(hotkeys), responsive_uids)
+    available_pool = make_available_pool(
+        uids,
+        exclude_mask,
+        epoch_counts,
+        local_counts,
+        global_counts,
+    )
     selected: List[int] = []
     observer_hotkeys: List[str] = []
     nonresponsive_skipped_uids: List[int] = []
 
     # Don't include active miner with more than 2 games
-    active_miner_uids_to_exclude = [
-        int(uid)
-        for uid in self.metagraph.uids
-        if active_miners.count(self.metagraph.hotkeys[uid]) >= 2
-    ]
+    active_miner_uids_to_exclude = uids[active_counts >= 2].tolist()
     bt.logging.info(f"Active miner uids to exclude: {active_miner_uids_to_exclude}")
-    exclude_set.update(uid for uid in active_miner_uids_to_exclude)
+    exclude_mask[active_miner_uids_to_exclude] = True
 
     # Step 1: Select first player:
     while len(selected) < 1 and available_pool:
 
-        for uid in list(available_pool):
-
-            if uid in selected:
-                continue
-
-            hotkey = self.metagraph.hotkeys[uid]
-
-            available_pool.remove(uid)
-
-            observer_hotkeys.append(hotkey)
-            exclude_set.add(uid)
-
-            if uid not in responsive_uids:
-                nonresponsive_skipped_uids.append(int(uid))
+        for uid in _random_order(available_pool):
+            exclude_mask[uid] = True
+            if not responsive_mask[uid]:
+                observer_hotkeys.append(hotkeys[uid])
+                nonresponsive_skipped_uids.append(uid)
                 continue
 
             selected.append(uid)
-            observer_hotkeys.pop()
-
             bt.logging.info(f"Selected first player: {uid}")
             break
+        else:
+            # Every uid in this tier was rejected, so move on to the next
+            # lowest count tier; once a player is picked the pool is unused.
+            available_pool = make_available_pool(
+                uids,
+                exclude_mask,
+                epoch_counts,
+                local_counts,
+                global_counts,
+            )
 
-        available_pool = make_available_pool(self, list(exclude_set))
-
-    bt.logging.debug(f"Excluded uids after first selection: {exclude_set}")
+    if debug_enabled():
+        bt.logging.debug(
+            f"Excluded uids after first selection: {uids[exclude_mask].tolist()}"
+        )
 
     if len(selected) == 0:
         bt.logging.error("No available miners could be selected.")
         return [], [], {}
 
     while len(selected) < k:
-        available_pool = make_available_pool_for_second_player(self, list(exclude_set))
+        available_pool = make_available_pool(
+            uids,
+            exclude_mask,
+            epoch_counts,
+            local_counts,
+            global_counts,
+            second_player=True,
+        )
         if not available_pool:
             bt.logging.warning("No available miners left to select from.")
             break
-        for uid in list(available_pool):
-            hotkey = self.metagraph.hotkeys[uid]
-
-            available_pool.remove(uid)
-            observer_hotkeys.append(hotkey)
-            exclude_set.add(uid)
-
-            if uid not in responsive_uids:
-                nonresponsive_skipped_uids.append(int(uid))
+        for uid in _random_order(available_pool):
+            exclude_mask[uid] = True
+            if not responsive_mask[uid]:
+                observer_hotkeys.append(hotkeys[uid])
+                nonresponsive_skipped_uids.append(uid)
                 continue
 
             selected.append(uid)
-            observer_hotkeys.pop()
             break
 
     if len(selected) < k:
@@ -296,7 +286,7 @@ async def choose_players(
         )
     else:
         bt.logging.info(
-            f"Selected miners: {selected}, selected counts: {[self._local_counts_in_window.get(self.metagraph.hotkeys[uid], 0) for uid in selected]}"
+            f"Selected miners: {selected}, selected counts: {local_counts[selected].tolist()}"
         )
 
     if nonresponsive_skipped_uids:
@@ -304,15 +294,14 @@ async def choose_players(
         _log_yellow_info(f"UIDs not in responsive set: {deduped}")
 
     random.shuffle(selected)
+    selected_metadata = await asyncio.gather(
+        *(get_metadata(self, targon_endpoints[uid], hotkeys[uid]) for uid in selected)
+    )
     metadata = {
         uid: {
             "endpoint": targon_endpoints[uid],
-            "reasoning": (
-                await get_metadata(
-                    self, targon_endpoints[uid], self.metagraph.hotkeys[uid]
-                )
-            ).get("reasoning", "none"),
+            "reasoning": meta.get("reasoning", "none"),
         }
-        for uid in selected
+        for uid, meta in zip(selected, selected_metadata)
     }
     return selected, observer_hotkeys, metadata
@@ -1,7 +1,15 @@
+import hashlib
+import os
 from pathlib import Path
 
+_PROMPTS_DIR = Path(__file__).resolve().parents[2] / "data" / "prompts"
+# Keyed on (mtime_ns, size): coarse-mtime filesystems can keep the same
+# mtime across a rewrite, but the size usually still changes.
 _PROMPT_CACHE: dict[str, str] = {}
-_PROMPT_MTIME: dict[str, float] = {}
+_PROMPT_STAT: dict[str, tuple[int, int]] = {}
+_PROMPT_DIGEST: dict[str, bytes] = {}
+# role prompt name -> (base text, role text, combined prompt)
+_COMBINED_CACHE: dict[str, tuple[str, str, str]] = {}
 
 
 def load_prompt(prompt_name: str) -> str:
@@ -14,24 +22,35 @@ def load_prompt(prompt_name: str) -> str:
     Returns:
         The content of the prompt file as a string
     """
-    # Get the path to the prompts directory
-    game_root = Path(__file__).resolve().parents[2]
-    prompts_dir = game_root / "data" / "prompts"
-    prompt_file = prompts_dir / f"{prompt_name}.txt"
+    prompt_file = _PROMPTS_DIR / f"{prompt_name}.txt"
 
-    if not prompt_file.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
+    try:
+        st = prompt_file.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_file}") from None
 
-    mtime = prompt_file.stat().st_mtime
-    cached_mtime = _PROMPT_MTIME.get(prompt_name)
-    if prompt_name in _PROMPT_CACHE and cached_mtime == mtime:
+    if prompt_name in _PROMPT_CACHE and _PROMPT_STAT.get(prompt_name) == (
+        st.st_mtime_ns,
+        st.st_size,
+    ):
         return _PROMPT_CACHE[prompt_name]
 
-    with open(prompt_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    with open(prompt_file, "rb", buffering=0) as f:
+        # Take the key from the open file so it always describes the bytes
+        # read, even if the prompt is swapped between stat() and open().
+        st = os.fstat(f.fileno())
+        raw = f.read()
+    key = (st.st_mtime_ns, st.st_size)
+
+    # Deploys often rewrite prompts unchanged; keep the cached string then.
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    _PROMPT_STAT[prompt_name] = key
+    if prompt_name in _PROMPT_CACHE and _PROMPT_DIGEST.get(prompt_name) == digest:
+        return _PROMPT_CACHE[prompt_name]
 
+    content = raw.decode("utf-8")
     _PROMPT_CACHE[prompt_name] = content
-    _PROMPT_MTIME[prompt_name] = mtime
+    _PROMPT_DIGEST[prompt_name] = digest
     return content
 
 
@@ -40,27 +59,39 @@ def get_base_sys_prompt() -> str:
     return load_prompt("baseSysPrompt")
 
 
+def _combined_prompt(role_prompt_name: str) -> str:
+    """Return the base prompt joined with a role prompt.
+
+    load_prompt hands back the same string objects until a file's content
+    changes, so the joined prompt is rebuilt only when either part does.
+    """
+    base_prompt = get_base_sys_prompt()
+    role_prompt = load_prompt(role_prompt_name)
+    cached = _COMBINED_CACHE.get(role_prompt_name)
+    if cached is not None and cached[0] is base_prompt and cached[1] is role_prompt:
+        return cached[2]
+    combined = f"{base_prompt}\n\n{role_prompt}"
+    _COMBINED_CACHE[role_prompt_name] = (base_prompt, role_prompt, combined)
+    return combined
+
+
 def get_op_sys_prompt() -> str:
     """Load the operative system prompt (includes base prompt)."""
-    base_prompt = get_base_sys_prompt()
-    op_specific = load_prompt("opSysPrompt")
-    return f"{base_prompt}\n\n{op_specific}"
+    return _combined_prompt("opSysPrompt")
 
 
 def get_spy_sys_prompt() -> str:
     """Load the spymaster system prompt (includes base prompt)."""
-    base_prompt = get_base_sys_prompt()
-    spy_specific = load_prompt("spySysPrompt")
-    return f"{base_prompt}\n\n{spy_specific}"
+    return _combined_prompt("spySysPrompt")
 
 
 def get_rule_sys_prompt() -> str:
     """Load the rule moderator system prompt (includes base prompt)."""
-    base_prompt = get_base_sys_prompt()
-    rule_specific = load_prompt("ruleSysPrompt")
-    return f"{base_prompt}\n\n{rule_specific}"
+    return _combined_prompt("ruleSysPrompt")
 
 
 def clear_prompt_cache() -> None:
     _PROMPT_CACHE.clear()
-    _PROMPT_MTIME.clear()
+    _PROMPT_STAT.clear()
+    _PROMPT_DIGEST.clear()
+    _COMBINED_CACHE.clear()
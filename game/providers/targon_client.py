@@ -2,10 +2,13 @@ import os
 import bittensor as bt
 import asyncio
 import aiohttp
-from game.common.epistula import generate_header
+from game.common.epistula import EMPTY_BODY_HASH, generate_header_prehashed
 from game.common.targon import extract_workload_uid, normalize_endpoint_url
 from game import __image_hash__
 
+# Upper bound on endpoint probes in flight at once, to keep socket bursts in check.
+MAX_CONCURRENT_ENDPOINT_CHECKS = 64
+
 
 def _log_yellow_info(message: str) -> None:
     bt.logging.info(f"\033[33m{message}\033[0m")
@@ -22,7 +25,7 @@ async def get_metadata(self, endpoint: str, hotkey: str) -> dict:
     """
     try:
         url = f"{normalize_endpoint_url(endpoint)}/meta"
-        headers = generate_header(self.wallet.hotkey, b"", hotkey)
+        headers = generate_header_prehashed(self.wallet.hotkey, EMPTY_BODY_HASH, hotkey)
         async with aiohttp.ClientSession() as session:
             async with session.get(url, headers=headers) as response:
                 if response.status == 200:
@@ -42,11 +45,18 @@ async def _check_image_hash(self, endpoint: str, uid: int | None = None) -> bool
     Returns:
         bool: True if the image hash matches, False otherwise.
     """
+    api_key = os.getenv("TARGON_API_KEY")
+    if not api_key:
+        # Every verify call would be rejected; skip the round-trip entirely.
+        bt.logging.debug(
+            f"TARGON_API_KEY not set; skipping image hash check for {endpoint}"
+        )
+        return False
     try:
         url = f"https://api.targon.com/tha/v2/workloads/verify"
         workload_uid = extract_workload_uid(endpoint)
         headers = {
-            "Authorization": f"Bearer {os.getenv('TARGON_API_KEY')}",
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
         async with aiohttp.ClientSession() as session:
@@ -140,39 +150,51 @@ async def _check_endpoint(self, uid: int, endpoint: str) -> bool:
 
 
 async def check_endpoints(
-    self, targon_endpoints: dict[int, str], timeout: int = 30
+    self,
+    targon_endpoints: dict[int, str],
+    timeout: int = 30,
+    max_concurrency: int = MAX_CONCURRENT_ENDPOINT_CHECKS,
 ) -> list[int]:
     """Checks the given Targon endpoints for responsiveness.
 
     Args:
         targon_endpoints (dict[int, str]): A dictionary mapping UIDs to their Targon endpoints.
         timeout (int): Timeout in seconds for each endpoint check.
+        max_concurrency (int): Maximum number of endpoint checks in flight at once.
 
     Returns:
         Tuple[List[int], List[int]]: A tuple containing a list of responsive UIDs and a list of unresponsive UIDs.
     """
     responsive_uids = []
+    if not os.getenv("TARGON_API_KEY"):
+        bt.logging.warning(
+            "TARGON_API_KEY is not set; no endpoint can pass the image hash check."
+        )
 
-    # make tasks for each endpoint check
-    tasks = []
-    for uid, endpoint in targon_endpoints.items():
-        tasks.append(
-            (
-                uid,
-                asyncio.wait_for(_check_endpoint(self, uid, endpoint), timeout=timeout),
+    # Probe the endpoints concurrently; each check is bounded by its own
+    # timeout, which only starts once the check gets a concurrency slot.
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded_check(uid: int) -> bool:
+        async with semaphore:
+            return await asyncio.wait_for(
+                _check_endpoint(self, uid, targon_endpoints[uid]), timeout=timeout
             )
-        )
-    # gather results
-    for uid, task in tasks:
-        try:
-            result = await task
-            bt.logging.debug(f"Endpoint {targon_endpoints[uid]} responsive: {result}")
-            if result:
-                responsive_uids.append(uid)
-        except asyncio.TimeoutError:
+
+    uids = list(targon_endpoints)
+    results = await asyncio.gather(
+        *(_bounded_check(uid) for uid in uids), return_exceptions=True
+    )
+    for uid, result in zip(uids, results):
+        endpoint = targon_endpoints[uid]
+        if isinstance(result, asyncio.TimeoutError):
             continue
-        except Exception as e:
-            bt.logging.error(f"Error checking endpoint {endpoint}: {e}")
+        # gather can also hand back a CancelledError, which is not an Exception.
+        if isinstance(result, BaseException):
+            bt.logging.error(f"Error checking endpoint {endpoint}: {result!r}")
             continue
+        bt.logging.debug(f"Endpoint {endpoint} responsive: {result}")
+        if result is True:
+            responsive_uids.append(uid)
 
     return responsive_uids
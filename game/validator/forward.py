@@ -17,7 +17,9 @@
 # DEALINGS IN THE SOFTWARE.
 
 import asyncio
+import random
 import time
+from functools import lru_cache, partial
 import bittensor as bt
 import aiohttp
 import json
@@ -25,6 +27,7 @@ import json
 import httpx
 from game.protocol import GameChatMessage, GameSynapse, GameSynapseOutput
 from game.common.epistula import generate_header
+from game.common.logging import debug_enabled
 from game.common.misc import extract_json
 from game.common.targon import normalize_endpoint_url
 from game.plugins.codenames.prompt_loader import (
@@ -49,10 +52,17 @@ from openai import OpenAI
 import os
 
 
+@lru_cache(maxsize=1)
+def _codenames_judge_client(api_key: str | None, base_url: str) -> OpenAI:
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
 def _get_codenames_judge_client() -> OpenAI:
-    return OpenAI(
-        api_key=os.getenv("CHUTES_API_KEY"),
-        base_url=os.getenv("CHUTES_BASE_URL", "https://llm.chutes.ai/v1"),
+    # Reuse one client (and its connection pool) across clue checks; a new
+    # one is only built if the configured key or endpoint changes.
+    return _codenames_judge_client(
+        os.getenv("CHUTES_API_KEY"),
+        os.getenv("CHUTES_BASE_URL", "https://llm.chutes.ai/v1"),
     )
 
 
@@ -90,64 +100,68 @@ def resetAnimations(self, cards):
         card.was_recently_revealed = False
 
 
-async def create_room(self, game_state: GameState):
+def _participants_payload(game_state: GameState) -> list[dict]:
+    """Serialise the participants; they are fixed for the whole game, so
+    ``forward`` builds this once and passes it to every room payload."""
+    return [
+        {
+            "name": p.name,
+            "hotkey": p.hotkey,
+            "team": p.team.value,
+            "role": p.role.value,
+        }
+        for p in game_state.participants
+    ]
+
+
+async def create_room(self, game_state: GameState, participants_payload: list[dict]):
     endpoint = f"{self.backend_base}/api/v1/games/{self.game.value}/create"
     try:
-        async with aiohttp.ClientSession() as session:
-            payload = {
-                "validatorKey": self.wallet.hotkey.ss58_address,
-                "competition": game_state.competition.value,
-                "cards": [
-                    {
-                        "word": card.word,
-                        "color": card.color,
-                        "isRevealed": card.is_revealed,
-                        "wasRecentlyRevealed": card.was_recently_revealed,
-                    }
-                    for card in game_state.cards
-                ],
-                "chatHistory": [],  # Game just started, no chat history yet
-                "currentTeam": game_state.currentTeam.value,
-                "currentRole": game_state.currentRole.value,
-                "previousTeam": None,  # Game just started, no previous team
-                "previousRole": None,  # Game just started, no previous role
-                "remainingRed": game_state.remainingRed,
-                "remainingBlue": game_state.remainingBlue,
-                "currentClue": None,  # Game just started, no current clue
-                "currentGuesses": [],  # Game just started, no guesses yet
-                "gameWinner": None,  # Game just started, no winner
-                "participants": [
-                    {
-                        "name": p.name,
-                        "hotkey": p.hotkey,
-                        "team": p.team.value,
-                        "role": p.role.value,
-                    }
-                    for p in game_state.participants
-                ],
-            }
-            headers = self.build_signed_headers()
-            async with session.post(
-                endpoint, json=payload, headers=headers, timeout=10
-            ) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    bt.logging.error(
-                        f"Failed to create new room: HTTP {response.status} - {text}"
-                    )
+        session = await self.get_http_session()
+        payload = {
+            "validatorKey": self.wallet.hotkey.ss58_address,
+            "competition": game_state.competition.value,
+            "cards": [
+                {
+                    "word": card.word,
+                    "color": card.color,
+                    "isRevealed": card.is_revealed,
+                    "wasRecentlyRevealed": card.was_recently_revealed,
+                }
+                for card in game_state.cards
+            ],
+            "chatHistory": [],  # Game just started, no chat history yet
+            "currentTeam": game_state.currentTeam.value,
+            "currentRole": game_state.currentRole.value,
+            "previousTeam": None,  # Game just started, no previous team
+            "previousRole": None,  # Game just started, no previous role
+            "remainingRed": game_state.remainingRed,
+            "remainingBlue": game_state.remainingBlue,
+            "currentClue": None,  # Game just started, no current clue
+            "currentGuesses": [],  # Game just started, no guesses yet
+            "gameWinner": None,  # Game just started, no winner
+            "participants": participants_payload,
+        }
+        headers = self.build_signed_headers()
+        async with session.post(
+            endpoint, json=payload, headers=headers, timeout=10
+        ) as response:
+            if response.status != 200:
+                text = await response.text()
+                bt.logging.error(
+                    f"Failed to create new room: HTTP {response.status} - {text}"
+                )
+                return None
+            else:
+                try:
+                    response_data = await response.json(content_type=None)
+                    room_id = response_data["data"]["id"]
+                    bt.logging.info(f"Room created successfully. Room ID: {room_id}")
+                    bt.logging.debug(f"Room creation response: {response_data}")
+                    return room_id
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    bt.logging.error(f"Failed to parse room creation response: {e}")
                     return None
-                else:
-                    response_text = await response.text()
-                    try:
-                        room_id = json.loads(response_text)["data"]["id"]
-                        bt.logging.info(
-                            f"Room created successfully. Room ID: {room_id}"
-                        )
-                        bt.logging.debug(f"Room creation response: {response_text}")
-                        return room_id
-                    except (json.JSONDecodeError, KeyError) as e:
-                        bt.logging.error(f"Failed to parse room creation response: {e}")
-                        return None
     except aiohttp.ClientError as e:
         bt.logging.error(f"Network error creating room: {e}")
         return None
@@ -159,79 +173,74 @@ async def create_room(self, game_state: GameState):
         return None
 
 
-async def update_room(self, game_state: GameState, roomId):
+def _room_state_payload(
+    self, game_state: GameState, participants_payload: list[dict]
+) -> dict:
+    return {
+        "competition": game_state.competition.value,
+        "validatorKey": self.wallet.hotkey.ss58_address,
+        "cards": [
+            {
+                "word": card.word,
+                "color": card.color,
+                "isRevealed": card.is_revealed,
+                "wasRecentlyRevealed": card.was_recently_revealed,
+            }
+            for card in game_state.cards
+        ],
+        "chatHistory": [
+            {
+                "sender": msg.sender.value,
+                "message": msg.message,
+                "team": msg.team.value,
+                "reasoning": msg.reasoning,
+                "clueText": msg.clueText,
+                "number": msg.number,
+                "guesses": msg.guesses,
+            }
+            for msg in game_state.chatHistory
+        ],
+        "currentTeam": game_state.currentTeam.value,
+        "currentRole": game_state.currentRole.value,
+        "previousTeam": (
+            game_state.previousTeam.value if game_state.previousTeam else None
+        ),
+        "previousRole": (
+            game_state.previousRole.value if game_state.previousRole else None
+        ),
+        "remainingRed": game_state.remainingRed,
+        "remainingBlue": game_state.remainingBlue,
+        "currentClue": (
+            {
+                "clueText": game_state.currentClue.clueText,
+                "number": game_state.currentClue.number,
+            }
+            if game_state.currentClue
+            else None
+        ),
+        "currentGuesses": (
+            list(game_state.currentGuesses) if game_state.currentGuesses else []
+        ),
+        "gameWinner": game_state.gameWinner.value if game_state.gameWinner else None,
+        "participants": participants_payload,
+    }
+
+
+async def _send_room_update(self, payload: dict, roomId):
     endpoint = f"{self.backend_base}/api/v1/games/{self.game.value}/{roomId}"
     try:
-        async with aiohttp.ClientSession() as session:
-            payload = {
-                "competition": game_state.competition.value,
-                "validatorKey": self.wallet.hotkey.ss58_address,
-                "cards": [
-                    {
-                        "word": card.word,
-                        "color": card.color,
-                        "isRevealed": card.is_revealed,
-                        "wasRecentlyRevealed": card.was_recently_revealed,
-                    }
-                    for card in game_state.cards
-                ],
-                "chatHistory": [
-                    {
-                        "sender": msg.sender.value,
-                        "message": msg.message,
-                        "team": msg.team.value,
-                        "reasoning": msg.reasoning,
-                        "clueText": msg.clueText,
-                        "number": msg.number,
-                        "guesses": msg.guesses,
-                    }
-                    for msg in game_state.chatHistory
-                ],
-                "currentTeam": game_state.currentTeam.value,
-                "currentRole": game_state.currentRole.value,
-                "previousTeam": (
-                    game_state.previousTeam.value if game_state.previousTeam else None
-                ),
-                "previousRole": (
-                    game_state.previousRole.value if game_state.previousRole else None
-                ),
-                "remainingRed": game_state.remainingRed,
-                "remainingBlue": game_state.remainingBlue,
-                "currentClue": (
-                    {
-                        "clueText": game_state.currentClue.clueText,
-                        "number": game_state.currentClue.number,
-                    }
-                    if game_state.currentClue
-                    else None
-                ),
-                "currentGuesses": (
-                    game_state.currentGuesses if game_state.currentGuesses else []
-                ),
-                "gameWinner": (
-                    game_state.gameWinner.value if game_state.gameWinner else None
-                ),
-                "participants": [
-                    {
-                        "name": p.name,
-                        "hotkey": p.hotkey,
-                        "team": p.team.value,
-                        "role": p.role.value,
-                    }
-                    for p in game_state.participants
-                ],
-            }
-            headers = self.build_signed_headers()
-            async with session.patch(
-                endpoint, json=payload, headers=headers, timeout=10
-            ) as response:
-                if response.status != 200:
-                    response_text = await response.text()
-                    bt.logging.error(
-                        f"Failed to update room state: HTTP {response.status} - {response_text}"
-                    )
-                else:
-                    bt.logging.info("Room state updated successfully")
+        session = await self.get_http_session()
+        headers = self.build_signed_headers()
+        async with session.patch(
+            endpoint, json=payload, headers=headers, timeout=10
+        ) as response:
+            if response.status != 200:
+                response_text = await response.text()
+                bt.logging.error(
+                    f"Failed to update room state: HTTP {response.status} - {response_text}"
+                )
+            else:
+                bt.logging.info("Room state updated successfully")
     except aiohttp.ClientError as e:
         bt.logging.error(f"Network error updating room {roomId}: {e}")
     except asyncio.TimeoutError:
@@ -240,22 +249,42 @@ async def update_room(self, game_state: GameState, roomId):
         bt.logging.error(f"Unexpected error updating room {roomId}: {e}")
 
 
+def queue_room_update(
+    self,
+    game_state: GameState,
+    roomId,
+    participants_payload: list[dict],
+    previous: typing.Optional[asyncio.Task] = None,
+) -> asyncio.Task:
+    """Snapshot the room state now and send it in the background.
+
+    The update is sent after ``previous`` finishes so the backend sees the
+    turns in order; the game loop only has to await the last task it got back.
+    """
+    payload = _room_state_payload(self, game_state, participants_payload)
+
+    async def _send_after_previous():
+        if previous is not None:
+            await previous
+        await _send_room_update(self, payload, roomId)
+
+    return asyncio.create_task(_send_after_previous())
+
+
 async def remove_room(self, roomId):
     # return
     endpoint = f"{self.backend_base}/api/v1/games/{self.game.value}/{roomId}"
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = self.build_signed_headers()
-            async with session.delete(
-                endpoint, headers=headers, timeout=10
-            ) as response:
-                if response.status != 200:
-                    response_text = await response.text()
-                    bt.logging.error(
-                        f"Failed to delete room: HTTP {response.status} - {response_text}"
-                    )
-                else:
-                    bt.logging.info("Room deleted successfully")
+        session = await self.get_http_session()
+        headers = self.build_signed_headers()
+        async with session.delete(endpoint, headers=headers, timeout=10) as response:
+            if response.status != 200:
+                response_text = await response.text()
+                bt.logging.error(
+                    f"Failed to delete room: HTTP {response.status} - {response_text}"
+                )
+            else:
+                bt.logging.info("Room deleted successfully")
     except aiohttp.ClientError as e:
         bt.logging.error(f"Network error deleting room {roomId}: {e}")
     except asyncio.TimeoutError:
@@ -285,14 +314,18 @@ async def get_tvm_response(
                 ),
                 timeout=80,
             )
-            bt.logging.debug(f"TVM response: {result.choices[0].message.content}")
+            if debug_enabled():
+                bt.logging.debug(f"TVM response: {result.choices[0].message.content}")
             return result.choices[0].message.content, False
         except asyncio.TimeoutError:
             bt.logging.error("Timeout error fetching response from TVM")
             return None, False
         except Exception as e:
             bt.logging.error(f"Error fetching response from TVM: {e}")
-            bt.logging.debug(f"Messages sent to TVM: {json.dumps(messages, indent=2)}")
+            if debug_enabled():
+                bt.logging.debug(
+                    f"Messages sent to TVM: {json.dumps(messages, indent=2)}"
+                )
             return None, True
 
     # Build board and clue strings outside the f-string to avoid backslash-in-expression errors.
@@ -308,8 +341,18 @@ async def get_tvm_response(
         ]
         clue_block = f"Your Clue: {synapse.your_clue}\nNumber: {synapse.your_number}"
     else:
-        board = synapse.cards
+        board = [
+            {
+                "word": card.word,
+                "isRevealed": card.is_revealed,
+                "color": card.color,
+            }
+            for card in synapse.cards
+        ]
         clue_block = ""
+    # Compact JSON keeps the board short in tokens; the repr of CardType models
+    # spelled out every field name and default for all 25 cards.
+    board_json = json.dumps(board, separators=(",", ":"))
 
     userPrompt = f"""
     ### Current Game State
@@ -318,7 +361,7 @@ async def get_tvm_response(
     Red Cards Left to Guess: {synapse.remaining_red}
     Blue Cards Left to Guess: {synapse.remaining_blue}
 
-    Board: {board}
+    Board: {board_json}
 
     {clue_block}"""
     messages = []
@@ -334,12 +377,15 @@ async def get_tvm_response(
     )
     messages.append({"role": "user", "content": userPrompt})
 
-    retry = 0
-    while retry < 2:
+    # Same two-attempt budget as before; the short jittered pause keeps a
+    # rate-limited endpoint from being hit again immediately without
+    # stretching the miner's turn.
+    max_attempts = 2
+    for attempt in range(max_attempts):
         response_str, should_retry = await _get_response(messages)
-        if response_str or not should_retry:
+        if response_str or not should_retry or attempt == max_attempts - 1:
             break
-        retry += 1
+        await asyncio.sleep(0.5 + 0.5 * random.random())
     try:
         response_dict = extract_json(response_str)
     except Exception as e:
@@ -396,10 +442,11 @@ async def forward(self):
     bs_uid = blue_team["spymaster"]
     bo_uid = blue_team["operative"]
 
-    rs_hotkey = self.metagraph.axons[rs_uid].hotkey
-    ro_hotkey = self.metagraph.axons[ro_uid].hotkey
-    bs_hotkey = self.metagraph.axons[bs_uid].hotkey
-    bo_hotkey = self.metagraph.axons[bo_uid].hotkey
+    hotkeys = self.metagraph.hotkeys
+    rs_hotkey = hotkeys[rs_uid]
+    ro_hotkey = hotkeys[ro_uid]
+    bs_hotkey = hotkeys[bs_uid]
+    bo_hotkey = hotkeys[bo_uid]
 
     invalid_respond_counts = {
         miner_uids[0]: 0,
@@ -407,61 +454,54 @@ async def forward(self):
     }
 
     participants: typing.List[TParticipant] = []
-    for team in [red_team, blue_team]:
-        participants.append(
-            TParticipant(
-                name=(
-                    ("Miner " + str(team["spymaster"]))
-                    if team["spymaster"] != self.uid
-                    else "Validator"
-                ),
-                hotkey=self.metagraph.axons[team["spymaster"]].hotkey,
-                team=TeamColor.RED if team == red_team else TeamColor.BLUE,
-                role=Role.SPYMASTER,
-            )
-        )
-        participants.append(
-            TParticipant(
-                name=(
-                    ("Miner " + str(team["operative"]))
-                    if team["operative"] != self.uid
-                    else "Validator"
-                ),
-                hotkey=self.metagraph.axons[team["operative"]].hotkey,
-                team=TeamColor.RED if team == red_team else TeamColor.BLUE,
-                role=Role.OPERATIVE,
+    for team_color, team in ((TeamColor.RED, red_team), (TeamColor.BLUE, blue_team)):
+        for role_key, role in (
+            ("spymaster", Role.SPYMASTER),
+            ("operative", Role.OPERATIVE),
+        ):
+            uid = team[role_key]
+            participants.append(
+                TParticipant(
+                    name=f"Miner {uid}" if uid != self.uid else "Validator",
+                    hotkey=hotkeys[uid],
+                    team=team_color,
+                    role=role,
+                )
             )
-        )
-    for hotkey in observer_hotkeys:
-        uid = self.metagraph.hotkeys.index(hotkey)
+    # Look each observer up once; the uids are reused for the log line below.
+    observer_uids = [hotkeys.index(hotkey) for hotkey in observer_hotkeys]
+    for uid, hotkey in zip(observer_uids, observer_hotkeys):
         participants.append(
             TParticipant(
-                name=("Miner " + str(uid)),
+                name=f"Miner {uid}",
                 hotkey=hotkey,
                 team=TeamColor.OBSERVER,
                 role=Role.OBSERVER,
             )
         )
-    observer_uids = [
-        self.metagraph.hotkeys.index(hotkey) for hotkey in observer_hotkeys
-    ]
     if observer_uids:
         bt.logging.info(f"\033[33mObservers: {observer_uids}\033[0m")
     # * Initialize game
     game_step = 0
     started_at = time.time()
     game_state = GameState(competition=competition, participants=participants)
+    # The board is fixed for the game, so guesses can be matched by lookup.
+    card_by_word = {card.word.lower(): card for card in game_state.cards}
+    participants_payload = _participants_payload(game_state)
     end_reason = "completed"
     MAX_GAME_STEPS = 50
 
     # Create new room via API call
     # ===============🤞ROOM CREATE===================
-    roomId = await create_room(self, game_state)
+    roomId = await create_room(self, game_state, participants_payload)
     if roomId is None:
         bt.logging.error("Failed to create room, exiting.")
-        time.sleep(10)
+        await asyncio.sleep(10)
         return
 
+    # Room updates are mirrored to the backend in the background, in order.
+    room_update: typing.Optional[asyncio.Task] = None
+
     # ===============GAME LOOP=======================
     bt.logging.info("╔══════════════════════════════════════════════════════════════╗")
     bt.logging.info("║                     🚀  GAME STARTING  🚀                    ║")
@@ -471,221 +511,124 @@ async def forward(self):
     bt.logging.info(
         "╚══════════════════════════════════════════════════════════════╝\n"
     )
-    while game_state.gameWinner is None and game_step < MAX_GAME_STEPS:
-        bt.logging.info("=" * 50)
-        bt.logging.info(f"Game step {game_step + 1}")
+    # Await the queued room updates even if the game loop raises, so none of
+    # the chained tasks is left pending.
+    try:
+        while game_state.gameWinner is None and game_step < MAX_GAME_STEPS:
+            bt.logging.info("=" * 50)
+            bt.logging.info(f"Game step {game_step + 1}")
 
-        should_skip_turn = False
+            should_skip_turn = False
 
-        bt.logging.info(
-            f"Current Role: {game_state.currentTeam.value} {game_state.currentRole.value}"
-        )
+            bt.logging.info(
+                f"Current Role: {game_state.currentTeam.value} {game_state.currentRole.value}"
+            )
 
-        # 1. Prepare the query
-        if game_state.currentRole == Role.SPYMASTER:
-            cards = game_state.cards
-            if game_state.currentTeam == TeamColor.RED:
-                to_uid = red_team["spymaster"]
-            else:
-                to_uid = blue_team["spymaster"]
-        else:
-            # If receiver is operative, we need to send the cards without color
-            cards = [
-                CardType(
-                    word=card.word,
-                    color=card.color if card.is_revealed else None,
-                    is_revealed=card.is_revealed,
-                    was_recently_revealed=card.was_recently_revealed,
-                )
-                for card in game_state.cards
-            ]
-            if game_state.currentTeam == TeamColor.RED:
-                to_uid = red_team["operative"]
+            # 1. Prepare the query
+            if game_state.currentRole == Role.SPYMASTER:
+                cards = game_state.cards
+                if game_state.currentTeam == TeamColor.RED:
+                    to_uid = red_team["spymaster"]
+                else:
+                    to_uid = blue_team["spymaster"]
             else:
-                to_uid = blue_team["operative"]
-
-            # Remove animation of recently revealed cards
-            resetAnimations(self, game_state.cards)
-
-        your_team = game_state.currentTeam
-        your_role = game_state.currentRole
-        remaining_red = game_state.remainingRed
-        remaining_blue = game_state.remainingBlue
-        your_clue = (
-            game_state.currentClue.clueText
-            if game_state.currentClue is not None
-            else None
-        )
-        your_number = (
-            game_state.currentClue.number
-            if game_state.currentClue is not None
-            else None
-        )
-
-        synapse = GameSynapse(
-            your_team=your_team,
-            your_role=your_role,
-            remaining_red=remaining_red,
-            remaining_blue=remaining_blue,
-            your_clue=your_clue,
-            your_number=your_number,
-            cards=cards,
-            chat_history=[
-                GameChatMessage(
-                    team=chat.team.value,
-                    sender=chat.sender.value,
-                    message=chat.message,
-                    clueText=chat.clueText,
-                    number=chat.number,
-                    guesses=chat.guesses,
-                )
-                for chat in game_state.chatHistory
-            ],
-        )
-
-        # 2. Main Game Logic
-        started_at = time.time()
-        # 2.1 Query the participant
-        response = None
+                # If receiver is operative, we need to send the cards without color
+                cards = [
+                    CardType(
+                        word=card.word,
+                        color=card.color if card.is_revealed else None,
+                        is_revealed=card.is_revealed,
+                        was_recently_revealed=card.was_recently_revealed,
+                    )
+                    for card in game_state.cards
+                ]
+                if game_state.currentTeam == TeamColor.RED:
+                    to_uid = red_team["operative"]
+                else:
+                    to_uid = blue_team["operative"]
 
-        endpoint = metadata[to_uid]["endpoint"]
-        reasoning_effort = metadata[to_uid]["reasoning"]
+                # Remove animation of recently revealed cards
+                resetAnimations(self, game_state.cards)
 
-        def _epistula_hook(request: httpx.Request) -> None:
-            body = request.read()
-            headers = generate_header(
-                self.wallet.hotkey, body, signed_for=self.metagraph.hotkeys[to_uid]
+            your_team = game_state.currentTeam
+            your_role = game_state.currentRole
+            remaining_red = game_state.remainingRed
+            remaining_blue = game_state.remainingBlue
+            your_clue = (
+                game_state.currentClue.clueText
+                if game_state.currentClue is not None
+                else None
             )
-            for key, value in headers.items():
-                request.headers[key] = value
-
-        for i in range(2):
-            sent_at = time.time()
-            response = await get_tvm_response(
-                _epistula_hook, synapse, endpoint, reasoning_effort
+            your_number = (
+                game_state.currentClue.number
+                if game_state.currentClue is not None
+                else None
             )
-            if response or (time.time() - sent_at) > 3:
-                break
-            bt.logging.warning(f"⏳ No response from miner {to_uid} ({i+1}/2)")
-        bt.logging.info(
-            f"⏫ Response from miner {to_uid} took {time.time() - started_at:.2f}s"
-        )
 
-        # 2.2 Check response
-        if response is None:
-            should_skip_turn = True
-            invalid_respond_counts[to_uid] += 1
-            bt.logging.warning(
-                f"No response from miner {to_uid} ({invalid_respond_counts[to_uid]}/2)"
-            )
-            if invalid_respond_counts[to_uid] < 2:
-                # Switch turn to the other team
-                game_state.chatHistory.append(
-                    ChatMessage(
-                        sender=your_role,
-                        message="⚠️ No response received! Switching turn to the other team.",
-                        team=game_state.currentTeam,
-                        reasoning="No response received.",
+            synapse = GameSynapse(
+                your_team=your_team,
+                your_role=your_role,
+                remaining_red=remaining_red,
+                remaining_blue=remaining_blue,
+                your_clue=your_clue,
+                your_number=your_number,
+                cards=cards,
+                chat_history=[
+                    GameChatMessage(
+                        team=chat.team.value,
+                        sender=chat.sender.value,
+                        message=chat.message,
+                        clueText=chat.clueText,
+                        number=chat.number,
+                        guesses=chat.guesses,
                     )
-                )
-            else:
-                game_state.gameWinner = (
-                    TeamColor.RED
-                    if game_state.currentTeam == TeamColor.BLUE
-                    else TeamColor.BLUE
-                )
-                resetAnimations(self, game_state.cards)
-                end_reason = "no_response"
-                bt.logging.info(
-                    f"💀 No response received! Game over. Winner: {game_state.gameWinner} (Room ID: {roomId})"
-                )
-                game_state.chatHistory.append(
-                    ChatMessage(
-                        sender=your_role,
-                        message=f"💀 No response received! Game over.",
-                        team=game_state.currentTeam,
-                        reasoning="No response received.",
-                    )
-                )
-                # End the game and remove from gameboard after 10 seconds
-                await update_room(self, game_state, roomId)
-                break
-
-        # 2.3 Turn/Role-based game logic
-        elif game_state.currentRole == Role.SPYMASTER:
-            # Get the clue and number from the response
-            clue = response.clue_text
-            number = response.number
-            reasoning = response.reasoning
-
-            async def check_valid_clue(clue, number, board_words):
-                if clue is None or number is None or number <= 0:
-                    return False, "Clue or number is None"
-
-                messages = []
-                messages.append({"role": "system", "content": get_rule_sys_prompt()})
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": f"Clue: {clue}, Number: {number}, Board Words: {board_words}",
-                    }
-                )
-
-                try:
-                    client = _get_codenames_judge_client()
-
-                    def _call_rule_judge():
-                        return client.chat.completions.create(
-                            model=_get_codenames_judge_model(),
-                            messages=messages,
-                            max_tokens=128,
-                            temperature=0.0,
-                            reasoning_effort="low",
-                        )
-
-                    result = await asyncio.to_thread(_call_rule_judge)
-                    content = ""
-                    if result.choices:
-                        content = str(result.choices[0].message.content or "")
-                    result_json = json.loads(content)
-                    if result_json.get("valid") is False:
-                        bt.logging.info(f"Clue check: {result_json}")
-                        return False, result_json.get("reason", "Invalid clue")
-                except Exception as e:  # noqa: BLE001
-                    bt.logging.warning(f"Rule validation error: {e}")
-
-                bt.logging.info(f"✅ Clue '{clue}' with number {number} is valid")
-                return True, "Clue is valid"
+                    for chat in game_state.chatHistory
+                ],
+            )
 
-            bt.logging.info(f"Clue: {clue}, Number: {number}")
-            # bt.logging.info(f"Reasoning: {reasoning}")
+            # 2. Main Game Logic
+            started_at = time.time()
+            # 2.1 Query the participant
+            response = None
 
-            board_words = [
-                card.word for card in game_state.cards if not card.is_revealed
-            ]
+            endpoint = metadata[to_uid]["endpoint"]
+            reasoning_effort = metadata[to_uid]["reasoning"]
 
-            game_state.currentClue = Clue(clueText=clue, number=number)
-            game_state.currentClue.clueText = clue
-            game_state.currentClue.number = number
+            def _epistula_hook(request: httpx.Request) -> None:
+                body = request.read()
+                headers = generate_header(
+                    self.wallet.hotkey, body, signed_for=hotkeys[to_uid]
+                )
+                for key, value in headers.items():
+                    request.headers[key] = value
 
-            is_valid_clue, reason = await check_valid_clue(clue, number, board_words)
+            for i in range(2):
+                sent_at = time.time()
+                response = await get_tvm_response(
+                    _epistula_hook, synapse, endpoint, reasoning_effort
+                )
+                if response or (time.time() - sent_at) > 3:
+                    break
+                bt.logging.warning(f"⏳ No response from miner {to_uid} ({i+1}/2)")
+            bt.logging.info(
+                f"⏫ Response from miner {to_uid} took {time.time() - started_at:.2f}s"
+            )
 
-            if not is_valid_clue:
+            # 2.2 Check response
+            if response is None:
                 should_skip_turn = True
                 invalid_respond_counts[to_uid] += 1
+                bt.logging.warning(
+                    f"No response from miner {to_uid} ({invalid_respond_counts[to_uid]}/2)"
+                )
                 if invalid_respond_counts[to_uid] < 2:
-                    bt.logging.info(
-                        f"❌ Invalid clue '{clue}' provided by miner {to_uid} for board words {board_words}. Reason: {reason}"
-                    )
-                    bt.logging.info(f"Skipping turn to the other team.")
+                    # Switch turn to the other team
                     game_state.chatHistory.append(
                         ChatMessage(
-                            sender=Role.SPYMASTER,
-                            message=f"Gave invalid clue '{clue}' with number {number}. Reason: {reason} Skipping turn.",
+                            sender=your_role,
+                            message="⚠️ No response received! Switching turn to the other team.",
                             team=game_state.currentTeam,
-                            clueText="null" if clue is None else clue,
-                            number=-1 if number is None else number,
-                            reasoning=reasoning,
+                            reasoning="No response received.",
                         )
                     )
                 else:
@@ -697,207 +640,296 @@ async def forward(self):
                     resetAnimations(self, game_state.cards)
                     end_reason = "no_response"
                     bt.logging.info(
-                        f"💀 Invalid clue provided! Game over. Winner: {game_state.gameWinner} (Room ID: {roomId})"
+                        f"💀 No response received! Game over. Winner: {game_state.gameWinner} (Room ID: {roomId})"
                     )
                     game_state.chatHistory.append(
                         ChatMessage(
                             sender=your_role,
-                            message=f"💀 Invalid clue provided! ({reason}) Game over.",
+                            message=f"💀 No response received! Game over.",
                             team=game_state.currentTeam,
-                            reasoning="Invalid clue provided.",
+                            reasoning="No response received.",
                         )
                     )
                     # End the game and remove from gameboard after 10 seconds
-                    await update_room(self, game_state, roomId)
-                    break
-
-            else:
-                game_state.chatHistory.append(
-                    ChatMessage(
-                        sender=Role.SPYMASTER,
-                        message=f"Gave clue '{clue}' with number {number}",
-                        team=game_state.currentTeam,
-                        clueText=clue,
-                        number=number,
-                        reasoning=reasoning,
+                    room_update = queue_room_update(
+                        self, game_state, roomId, participants_payload, room_update
                     )
-                )
-
-        elif game_state.currentRole == Role.OPERATIVE:
-            # Get the guessed cards from the response
-            guesses = response.guesses
-            reasoning = response.reasoning
-            bt.logging.info(f"Guessed cards: {guesses}")
-            if guesses is None or len(guesses) == 0:
-                invalid_respond_counts[to_uid] += 1
-                bt.logging.info(
-                    f"⚠️ No guesses '{guesses}' provided by miner {to_uid}."
-                )
-                if invalid_respond_counts[to_uid] < 2:
-                    # Switch turn to the other team
-                    game_state.chatHistory.append(
-                        ChatMessage(
-                            sender=Role.OPERATIVE,
-                            message="⚠️ No guesses provided! Switching turn to the other team.",
-                            team=game_state.currentTeam,
-                            reasoning="No guesses provided.",
-                        )
-                    )
-                else:
-                    # If the guesses is invalid, the other team wins
-                    game_state.gameWinner = (
-                        TeamColor.RED
-                        if game_state.currentTeam == TeamColor.BLUE
-                        else TeamColor.BLUE
-                    )
-                    resetAnimations(self, game_state.cards)
-                    end_reason = "no_response"
-                    bt.logging.info(
-                        f"❌ No guesses received! Game over. Winner: {game_state.gameWinner} (Room ID: {roomId})"
-                    )
-                    game_state.chatHistory.append(
-                        ChatMessage(
-                            sender=Role.OPERATIVE,
-                            message=f"❌ No guesses provided.",
-                            team=game_state.currentTeam,
-                            guesses=[],
-                            reasoning="No guesses provided.",
-                        )
-                    )
-                    await update_room(self, game_state, roomId)
                     break
-            else:
-                # Update the game state
-                choose_assasin = False
 
-                if len(guesses) > your_number + 1:
-                    bt.logging.info(
-                        f"⚠️ Too many guesses '{guesses}' provided by miner {to_uid} (allowed: {your_number + 1})."
+            # 2.3 Turn/Role-based game logic
+            elif game_state.currentRole == Role.SPYMASTER:
+                # Get the clue and number from the response
+                clue = response.clue_text
+                number = response.number
+                reasoning = response.reasoning
+
+                async def check_valid_clue(clue, number, board_words):
+                    if clue is None or number is None or number <= 0:
+                        return False, "Clue or number is None"
+                    # Settle the clear-cut rule breaks locally; only clues that
+                    # need a judgement call go to the rule judge model.
+                    if not isinstance(clue, str) or not clue.strip():
+                        return False, "Clue is empty"
+                    normalized_clue = clue.strip().lower()
+                    if any(normalized_clue == word.lower() for word in board_words):
+                        return False, "Clue is one of the words on the board"
+
+                    messages = []
+                    messages.append(
+                        {"role": "system", "content": get_rule_sys_prompt()}
                     )
-                    guesses = guesses[: your_number + 1]
-                    bt.logging.info(f"Truncated guesses to: {guesses}")
-                game_state.currentGuesses = guesses
-                game_state.chatHistory.append(
-                    ChatMessage(
-                        sender=Role.OPERATIVE,
-                        message=f"Guessed cards: {', '.join(guesses)}",
-                        team=game_state.currentTeam,
-                        reasoning=reasoning,
-                        guesses=guesses,
+                    messages.append(
+                        {
+                            "role": "user",
+                            "content": f"Clue: {clue}, Number: {number}, Board Words: {board_words}",
+                        }
                     )
+
+                    try:
+                        client = _get_codenames_judge_client()
+
+                        def _call_rule_judge():
+                            return client.chat.completions.create(
+                                model=_get_codenames_judge_model(),
+                                messages=messages,
+                                max_tokens=128,
+                                temperature=0.0,
+                                reasoning_effort="low",
+                            )
+
+                        result = await asyncio.to_thread(_call_rule_judge)
+                        content = ""
+                        if result.choices:
+                            content = str(result.choices[0].message.content or "")
+                        result_json = json.loads(content)
+                        if result_json.get("valid") is False:
+                            bt.logging.info(f"Clue check: {result_json}")
+                            return False, result_json.get("reason", "Invalid clue")
+                    except Exception as e:  # noqa: BLE001
+                        bt.logging.warning(f"Rule validation error: {e}")
+
+                    bt.logging.info(f"✅ Clue '{clue}' with number {number} is valid")
+                    return True, "Clue is valid"
+
+                bt.logging.info(f"Clue: {clue}, Number: {number}")
+                # bt.logging.info(f"Reasoning: {reasoning}")
+
+                board_words = [
+                    card.word for card in game_state.cards if not card.is_revealed
+                ]
+
+                game_state.currentClue = Clue(clueText=clue, number=number)
+
+                is_valid_clue, reason = await check_valid_clue(
+                    clue, number, board_words
                 )
-                for guess in guesses:
-                    card = next(
-                        (
-                            c
-                            for c in game_state.cards
-                            if c.word.lower() == guess.lower()
-                        ),
-                        None,
-                    )
-                    if card is None or card.is_revealed:
-                        bt.logging.debug(f"Invalid guess: {guess}")
-                        continue
-                    card.is_revealed = True
-                    card.was_recently_revealed = True
-                    if card.color == "red":
-                        game_state.remainingRed -= 1
-                    elif card.color == "blue":
-                        game_state.remainingBlue -= 1
-
-                    if game_state.remainingRed == 0:
-                        game_state.gameWinner = TeamColor.RED
-                        resetAnimations(self, game_state.cards)
-                        end_reason = "red_all_cards"
+
+                if not is_valid_clue:
+                    should_skip_turn = True
+                    invalid_respond_counts[to_uid] += 1
+                    if invalid_respond_counts[to_uid] < 2:
                         bt.logging.info(
-                            f"🎉 All red cards found! Winner: {game_state.gameWinner}"
+                            f"❌ Invalid clue '{clue}' provided by miner {to_uid} for board words {board_words}. Reason: {reason}"
                         )
+                        bt.logging.info(f"Skipping turn to the other team.")
                         game_state.chatHistory.append(
                             ChatMessage(
-                                sender=Role.OPERATIVE,
-                                message=f"🎉 All red cards found!",
+                                sender=Role.SPYMASTER,
+                                message=f"Gave invalid clue '{clue}' with number {number}. Reason: {reason} Skipping turn.",
                                 team=game_state.currentTeam,
-                                guesses=guesses,
+                                clueText="null" if clue is None else clue,
+                                number=-1 if number is None else number,
                                 reasoning=reasoning,
                             )
                         )
-                        await update_room(self, game_state, roomId)
-                        break
-                    elif game_state.remainingBlue == 0:
-                        game_state.gameWinner = TeamColor.BLUE
+                    else:
+                        game_state.gameWinner = (
+                            TeamColor.RED
+                            if game_state.currentTeam == TeamColor.BLUE
+                            else TeamColor.BLUE
+                        )
                         resetAnimations(self, game_state.cards)
-                        end_reason = "blue_all_cards"
+                        end_reason = "no_response"
                         bt.logging.info(
-                            f"🎉 All blue cards found! Winner: {game_state.gameWinner}"
+                            f"💀 Invalid clue provided! Game over. Winner: {game_state.gameWinner} (Room ID: {roomId})"
                         )
                         game_state.chatHistory.append(
                             ChatMessage(
-                                sender=Role.OPERATIVE,
-                                message=f"🎉 All blue cards found!",
+                                sender=your_role,
+                                message=f"💀 Invalid clue provided! ({reason}) Game over.",
                                 team=game_state.currentTeam,
-                                guesses=guesses,
-                                reasoning=reasoning,
+                                reasoning="Invalid clue provided.",
                             )
                         )
-                        await update_room(self, game_state, roomId)
+                        # End the game and remove from gameboard after 10 seconds
+                        room_update = queue_room_update(
+                            self, game_state, roomId, participants_payload, room_update
+                        )
                         break
 
-                    if card.color == "assassin":
-                        choose_assasin = True
+                else:
+                    game_state.chatHistory.append(
+                        ChatMessage(
+                            sender=Role.SPYMASTER,
+                            message=f"Gave clue '{clue}' with number {number}",
+                            team=game_state.currentTeam,
+                            clueText=clue,
+                            number=number,
+                            reasoning=reasoning,
+                        )
+                    )
+
+            elif game_state.currentRole == Role.OPERATIVE:
+                # Get the guessed cards from the response
+                guesses = response.guesses
+                reasoning = response.reasoning
+                bt.logging.info(f"Guessed cards: {guesses}")
+                if guesses is None or len(guesses) == 0:
+                    invalid_respond_counts[to_uid] += 1
+                    bt.logging.info(
+                        f"⚠️ No guesses '{guesses}' provided by miner {to_uid}."
+                    )
+                    if invalid_respond_counts[to_uid] < 2:
+                        # Switch turn to the other team
+                        game_state.chatHistory.append(
+                            ChatMessage(
+                                sender=Role.OPERATIVE,
+                                message="⚠️ No guesses provided! Switching turn to the other team.",
+                                team=game_state.currentTeam,
+                                reasoning="No guesses provided.",
+                            )
+                        )
+                    else:
+                        # If the guesses is invalid, the other team wins
                         game_state.gameWinner = (
                             TeamColor.RED
                             if game_state.currentTeam == TeamColor.BLUE
                             else TeamColor.BLUE
                         )
                         resetAnimations(self, game_state.cards)
-                        end_reason = "assassin"
+                        end_reason = "no_response"
                         bt.logging.info(
-                            f"💀 Assassin card '{card.word}' found! Game over. Winner: {game_state.gameWinner} (Room ID: {roomId})"
+                            f"❌ No guesses received! Game over. Winner: {game_state.gameWinner} (Room ID: {roomId})"
                         )
                         game_state.chatHistory.append(
                             ChatMessage(
                                 sender=Role.OPERATIVE,
-                                message=f"💀 Assassin card '{card.word}' found! Game over.",
+                                message=f"❌ No guesses provided.",
                                 team=game_state.currentTeam,
-                                guesses=guesses,
-                                reasoning=reasoning,
+                                guesses=[],
+                                reasoning="No guesses provided.",
                             )
                         )
-                        await update_room(self, game_state, roomId)
+                        room_update = queue_room_update(
+                            self, game_state, roomId, participants_payload, room_update
+                        )
                         break
+                else:
+                    # Update the game state
+                    if len(guesses) > your_number + 1:
+                        bt.logging.info(
+                            f"⚠️ Too many guesses '{guesses}' provided by miner {to_uid} (allowed: {your_number + 1})."
+                        )
+                        guesses = guesses[: your_number + 1]
+                        bt.logging.info(f"Truncated guesses to: {guesses}")
+                    game_state.currentGuesses = guesses
+                    # Every chat line for this guess turn shares these fields.
+                    operative_message = partial(
+                        ChatMessage,
+                        sender=Role.OPERATIVE,
+                        team=game_state.currentTeam,
+                        guesses=guesses,
+                        reasoning=reasoning,
+                    )
+                    game_state.chatHistory.append(
+                        operative_message(
+                            message=f"Guessed cards: {', '.join(guesses)}"
+                        )
+                    )
+                    current_team_value = game_state.currentTeam.value
+                    for guess in guesses:
+                        card = card_by_word.get(guess.lower())
+                        if card is None or card.is_revealed:
+                            bt.logging.debug(f"Invalid guess: {guess}")
+                            continue
+                        card.is_revealed = True
+                        card.was_recently_revealed = True
+                        if card.color == "red":
+                            game_state.remainingRed -= 1
+                        elif card.color == "blue":
+                            game_state.remainingBlue -= 1
+
+                        if game_state.remainingRed == 0:
+                            game_state.gameWinner = TeamColor.RED
+                            end_reason = "red_all_cards"
+                            end_message = "🎉 All red cards found!"
+                            break
+                        elif game_state.remainingBlue == 0:
+                            game_state.gameWinner = TeamColor.BLUE
+                            end_reason = "blue_all_cards"
+                            end_message = "🎉 All blue cards found!"
+                            break
+
+                        if card.color == "assassin":
+                            game_state.gameWinner = (
+                                TeamColor.RED
+                                if game_state.currentTeam == TeamColor.BLUE
+                                else TeamColor.BLUE
+                            )
+                            end_reason = "assassin"
+                            end_message = (
+                                f"💀 Assassin card '{card.word}' found! Game over."
+                            )
+                            break
 
-                    if card.color != game_state.currentTeam.value:
-                        # If the card is not of our team color, we break
-                        # This is to ensure that the operative only guesses cards of their team color
-                        bt.logging.warning(
-                            f"❌ Card {card.word} is not of team color {game_state.currentTeam.value}, breaking."
+                        if card.color != current_team_value:
+                            # If the card is not of our team color, we break
+                            # This is to ensure that the operative only guesses cards of their team color
+                            bt.logging.warning(
+                                f"❌ Card {card.word} is not of team color {current_team_value}, breaking."
+                            )
+                            break
+                    if game_state.gameWinner is not None:
+                        resetAnimations(self, game_state.cards)
+                        bt.logging.info(
+                            f"{end_message} Winner: {game_state.gameWinner} (Room ID: {roomId})"
+                        )
+                        game_state.chatHistory.append(
+                            operative_message(message=end_message)
+                        )
+                        room_update = queue_room_update(
+                            self, game_state, roomId, participants_payload, room_update
                         )
                         break
-                if choose_assasin or game_state.gameWinner is not None:
-                    break
 
-        # change the role
-        game_state.previousRole = game_state.currentRole
-        game_state.previousTeam = game_state.currentTeam
+            # change the role
+            game_state.previousRole = game_state.currentRole
+            game_state.previousTeam = game_state.currentTeam
 
-        if game_state.currentRole == Role.SPYMASTER:
-            if should_skip_turn:
+            if game_state.currentRole == Role.SPYMASTER:
+                if should_skip_turn:
+                    if game_state.currentTeam == TeamColor.RED:
+                        game_state.currentTeam = TeamColor.BLUE
+                    else:
+                        game_state.currentTeam = TeamColor.RED
+                else:
+                    game_state.currentRole = Role.OPERATIVE
+            else:
+                game_state.currentRole = Role.SPYMASTER
+                # change the team after operative moved
                 if game_state.currentTeam == TeamColor.RED:
                     game_state.currentTeam = TeamColor.BLUE
                 else:
                     game_state.currentTeam = TeamColor.RED
-            else:
-                game_state.currentRole = Role.OPERATIVE
-        else:
-            game_state.currentRole = Role.SPYMASTER
-            # change the team after operative moved
-            if game_state.currentTeam == TeamColor.RED:
-                game_state.currentTeam = TeamColor.BLUE
-            else:
-                game_state.currentTeam = TeamColor.RED
-        game_step += 1
+            game_step += 1
 
-        await update_room(self, game_state, roomId)
+            room_update = queue_room_update(
+                self, game_state, roomId, participants_payload, room_update
+            )
+
+    finally:
+        if room_update is not None:
+            await room_update
 
     if game_step >= MAX_GAME_STEPS:
         bt.logging.info(f"Maximum game steps reached ({game_step}). Game over!")
@@ -925,10 +957,7 @@ async def forward(self):
 
     bt.logging.info(f"Scored responses: {rewards}")
 
-    rewards_list = rewards.tolist() if hasattr(rewards, "tolist") else list(rewards)
-
-    def _score_at(index: int) -> float:
-        return float(rewards_list[index]) if index < len(rewards_list) else 0.0
+    score_rs, score_ro, score_bs, score_bo = (float(score) for score in rewards)
 
     try:
         await self.score_store.upload_score(
@@ -938,13 +967,13 @@ async def forward(self):
             ro=ro_hotkey,
             bs=bs_hotkey,
             bo=bo_hotkey,
-            score_rs=_score_at(0),
-            score_ro=_score_at(1),
-            score_bs=_score_at(2),
-            score_bo=_score_at(3),
+            score_rs=score_rs,
+            score_ro=score_ro,
+            score_bs=score_bs,
+            score_bo=score_bo,
             reason=end_reason,
         )
     except Exception as err:  # noqa: BLE001
         bt.logging.error(f"Failed to persist game score {roomId}: {err}")
 
-    time.sleep(1)
+    await asyncio.sleep(1)
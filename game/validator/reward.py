@@ -20,6 +20,21 @@ import numpy as np
 from typing import List, Dict
 import bittensor as bt
 
+
+def _read_only(values: List[float]) -> np.ndarray:
+    array = np.array(values)
+    array.flags.writeable = False
+    return array
+
+
+# Rewards in (red spymaster, red operative, blue spymaster, blue operative)
+# order. There are only three outcomes, so the arrays are shared and read-only.
+_WINNER_REWARDS = {
+    "red": _read_only([1.0, 0.0, 0.0, 0.0]),
+    "blue": _read_only([0.0, 0.0, 1.0, 0.0]),
+}
+_NO_WINNER_REWARDS = _read_only([0.0, 0.0, 0.0, 0.0])
+
 # def reward(winner, red_team:Dict, blue_team: Dict) -> float:
 #     """
 #     Reward the miner response to the dummy request. This method returns a reward
@@ -56,16 +71,9 @@ def get_rewards(
     - blue_team (Dict): A dictionary representing the blue team's members.
 
     Returns:
-    - np.ndarray: An array of rewards for the team members based on the game outcome.
+    - np.ndarray: A read-only array of rewards for the team members based on the game outcome.
     """
-    # Penalize loser for no response
-    loser_score = 0.0
-    if winner == "red":
-        rewards = np.array([1.0, 0.0, 0.0, 0.0])
-    elif winner == "blue":
-        rewards = np.array([0.0, 0.0, 1.0, 0.0])
-    else:
-        rewards = np.array([0.0, 0.0, 0.0, 0.0])
+    rewards = _WINNER_REWARDS.get(winner, _NO_WINNER_REWARDS)
 
     bt.logging.info(
         f"rewards: {rewards}, reason: {end_reason}, current_team: {current_team}, current_role: {current_role}"
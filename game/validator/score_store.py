@@ -3,16 +3,23 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import queue
 import sqlite3
 import time
 import threading
-from collections import defaultdict
-from typing import Dict, Iterable, Optional, Sequence
+from contextlib import contextmanager
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import aiohttp
 import bittensor as bt
 from game.common.misc import parse_ts
 
+# Idle read-only connections kept for reuse; extra concurrent readers get a
+# throwaway connection that is closed when returned.
+READ_POOL_SIZE = min(os.cpu_count() or 1, 8)
+
 
 class ScoreStore:
     """SQLite-backed store for finished game snapshots and backend synchronisation."""
@@ -24,17 +31,24 @@ class ScoreStore:
         fetch_url: Optional[str] = None,
         signer=None,
         generic_store=None,
+        session_factory=None,
     ):
         self.db_path = db_path
         self.backend_url = backend_url
         self.fetch_url = fetch_url
         self.signer = signer
         self.generic_store = generic_store
+        self.session_factory = session_factory
         folder = os.path.dirname(db_path)
         if folder:
             os.makedirs(folder, exist_ok=True)
         self._conn: Optional[sqlite3.Connection] = None
         self._lock = threading.RLock()
+        self._read_pool: queue.Queue[sqlite3.Connection] = queue.Queue(
+            maxsize=READ_POOL_SIZE
+        )
+        self._read_pool_lock = threading.Lock()
+        self._read_pool_closed = False
         bt.logging.info(f"ScoreStore using database at: {db_path}")
 
     @property
@@ -49,90 +63,171 @@ class ScoreStore:
                     )
                     self._conn.execute("PRAGMA journal_mode=WAL;")
                     self._conn.execute("PRAGMA synchronous=NORMAL;")
+                    # The window aggregations re-read the same pages every
+                    # round; map the file and keep a larger page cache.
+                    self._conn.execute("PRAGMA mmap_size=268435456;")
+                    self._conn.execute("PRAGMA cache_size=-65536;")
+                    self._conn.execute("PRAGMA temp_store=MEMORY;")
+                    self._conn.execute("PRAGMA busy_timeout=5000;")
+                    # Let sync bursts grow the WAL a little further before
+                    # an automatic checkpoint stalls the next write.
+                    self._conn.execute("PRAGMA wal_autocheckpoint=2000;")
         return self._conn
 
-    def init(self):
-        cur = self.conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS scores (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                room_id TEXT NOT NULL UNIQUE,
-                competition TEXT,
-                rs TEXT NOT NULL,
-                ro TEXT NOT NULL,
-                bs TEXT NOT NULL,
-                bo TEXT NOT NULL,
-                winner TEXT,
-                started_at INTEGER NOT NULL,
-                ended_at INTEGER NOT NULL,
-                score_rs REAL NOT NULL,
-                score_ro REAL NOT NULL,
-                score_bs REAL NOT NULL,
-                score_bo REAL NOT NULL,
-                reason TEXT,
-                synced_at INTEGER
-            );
-            """)
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            Path(self.db_path).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA query_only=ON;")
+        conn.execute("PRAGMA mmap_size=268435456;")
+        conn.execute("PRAGMA cache_size=-16384;")
+        conn.execute("PRAGMA busy_timeout=5000;")
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection from the pool.
+
+        Under WAL readers do not block on the writer, so window queries skip
+        ``self._lock`` and are not held up by a sync page being written.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+        try:
+            yield conn
+        finally:
+            self._release_reader(conn)
+
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        with self._read_pool_lock:
+            if not self._read_pool_closed:
+                try:
+                    self._read_pool.put_nowait(conn)
+                    return
+                except queue.Full:
+                    pass
+        conn.close()
+
+    @contextmanager
+    def _transaction(self, cur: sqlite3.Cursor):
+        """Run the enclosed statements as one write transaction.
+
+        The connection is in autocommit mode, so without this every row of an
+        ``executemany`` commits on its own.
+        """
+        cur.execute("BEGIN IMMEDIATE")
         try:
-            cur.execute("ALTER TABLE scores ADD COLUMN competition TEXT")
-        except sqlite3.OperationalError:
-            pass
-        cur.close()
+            yield cur
+            cur.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT (busy, I/O error) must not leave the shared
+            # writer connection stuck inside this transaction.
+            if self.conn.in_transaction:
+                cur.execute("ROLLBACK")
+            raise
+
+    def init(self):
         with self._lock:
             cur = self.conn.cursor()
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS miner_records (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    validator TEXT NOT NULL,
-                    competition TEXT NOT NULL,
-                    hotkey TEXT NOT NULL,
-                    room_id TEXT NOT NULL,
-                    score REAL NOT NULL,
-                    ts INTEGER NOT NULL,
-                    synced_at INTEGER NOT NULL
-                );
-                """)
-            cur.execute(
-                "CREATE INDEX IF NOT EXISTS idx_miner_records_validator ON miner_records(validator);"
-            )
-            cur.execute(
-                "CREATE INDEX IF NOT EXISTS idx_miner_records_competition ON miner_records(competition);"
-            )
-            cur.execute(
-                "CREATE INDEX IF NOT EXISTS idx_miner_records_hotkey ON miner_records(hotkey);"
-            )
-            cur.execute(
-                "CREATE INDEX IF NOT EXISTS idx_miner_records_room_id ON miner_records(room_id);"
-            )
-            cur.execute(
-                "CREATE UNIQUE INDEX IF NOT EXISTS idx_miner_records_room_id_hotkey ON miner_records(room_id, hotkey);"
-            )
-            self._ensure_miner_records_score_is_real(cur)
-
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS scores_all (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    room_id TEXT NOT NULL,
-                    competition TEXT NOT NULL,
-                    validator TEXT NOT NULL,
-                    rs TEXT NOT NULL,
-                    ro TEXT NOT NULL,
-                    bs TEXT NOT NULL,
-                    bo TEXT NOT NULL,
-                    winner TEXT,
-                    started_at INTEGER NOT NULL,
-                    ended_at INTEGER NOT NULL,
-                    score_rs REAL NOT NULL,
-                    score_ro REAL NOT NULL,
-                    score_bs REAL NOT NULL,
-                    score_bo REAL NOT NULL,
-                    reason TEXT,
-                    synced_at INTEGER
-                );
-                """)
-            cur.execute(
-                "CREATE UNIQUE INDEX IF NOT EXISTS idx_scores_all_room_id ON scores_all(room_id);"
-            )
+            with self._transaction(cur):
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS scores (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        room_id TEXT NOT NULL UNIQUE,
+                        competition TEXT,
+                        rs TEXT NOT NULL,
+                        ro TEXT NOT NULL,
+                        bs TEXT NOT NULL,
+                        bo TEXT NOT NULL,
+                        winner TEXT,
+                        started_at INTEGER NOT NULL,
+                        ended_at INTEGER NOT NULL,
+                        score_rs REAL NOT NULL,
+                        score_ro REAL NOT NULL,
+                        score_bs REAL NOT NULL,
+                        score_bo REAL NOT NULL,
+                        reason TEXT,
+                        synced_at INTEGER
+                    );
+                    """)
+                try:
+                    cur.execute("ALTER TABLE scores ADD COLUMN competition TEXT")
+                except sqlite3.OperationalError:
+                    pass
+                # Only unsynced games are indexed, so pending() stays cheap
+                # however long the history grows.
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_scores_pending ON scores(ended_at) WHERE synced_at IS NULL;"
+                )
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS miner_records (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        validator TEXT NOT NULL,
+                        competition TEXT NOT NULL,
+                        hotkey TEXT NOT NULL,
+                        room_id TEXT NOT NULL,
+                        score REAL NOT NULL,
+                        ts INTEGER NOT NULL,
+                        synced_at INTEGER NOT NULL
+                    );
+                    """)
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_miner_records_validator ON miner_records(validator);"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_miner_records_competition ON miner_records(competition);"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_miner_records_hotkey ON miner_records(hotkey);"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_miner_records_room_id ON miner_records(room_id);"
+                )
+                cur.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_miner_records_room_id_hotkey ON miner_records(room_id, hotkey);"
+                )
+                self._ensure_miner_records_score_is_real(cur)
+                # Window aggregations filter on (competition, ts) and read only
+                # these columns, so they can run as index-only range scans. The
+                # competition-only index is a prefix of this one.
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_miner_records_comp_ts_hotkey ON miner_records(competition, ts, hotkey, validator, score);"
+                )
+                cur.execute("DROP INDEX IF EXISTS idx_miner_records_competition;")
+
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS scores_all (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        room_id TEXT NOT NULL,
+                        competition TEXT NOT NULL,
+                        validator TEXT NOT NULL,
+                        rs TEXT NOT NULL,
+                        ro TEXT NOT NULL,
+                        bs TEXT NOT NULL,
+                        bo TEXT NOT NULL,
+                        winner TEXT,
+                        started_at INTEGER NOT NULL,
+                        ended_at INTEGER NOT NULL,
+                        score_rs REAL NOT NULL,
+                        score_ro REAL NOT NULL,
+                        score_bs REAL NOT NULL,
+                        score_bo REAL NOT NULL,
+                        reason TEXT,
+                        synced_at INTEGER
+                    );
+                    """)
+                cur.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_scores_all_room_id ON scores_all(room_id);"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_scores_all_comp_ended ON scores_all(competition, ended_at);"
+                )
+            cur.execute("PRAGMA optimize;")
             cur.close()
 
     def _ensure_miner_records_score_is_real(self, cur: sqlite3.Cursor) -> None:
@@ -249,7 +344,7 @@ class ScoreStore:
             )
             cur.close()
 
-    def pending(self) -> Iterable[Dict[str, object]]:
+    def pending(self, limit: Optional[int] = None) -> Iterable[Dict[str, object]]:
         columns = [
             "room_id",
             "competition",
@@ -266,13 +361,16 @@ class ScoreStore:
             "score_bo",
             "reason",
         ]
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute(
-                "SELECT {} FROM scores WHERE synced_at IS NULL ORDER BY ended_at ASC".format(
-                    ", ".join(columns)
-                )
+        with self._reader() as conn:
+            cur = conn.cursor()
+            query = "SELECT {} FROM scores WHERE synced_at IS NULL ORDER BY ended_at ASC".format(
+                ", ".join(columns)
             )
+            # ``limit=None`` returns every unsynced row.
+            if limit is None:
+                cur.execute(query)
+            else:
+                cur.execute(query + " LIMIT ?", (int(limit),))
             rows = [dict(zip(columns, row)) for row in cur.fetchall()]
             cur.close()
         return rows
@@ -284,14 +382,11 @@ class ScoreStore:
         end_ts: float,
         validator_hotkey: Optional[str] = None,
     ) -> Dict[str, float]:
-        avg_scores: Dict[str, float] = defaultdict(float)
-        total_scores: Dict[str, float] = defaultdict(float)
-        counts: Dict[str, float] = defaultdict(float)
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as conn:
+            cur = conn.cursor()
             params = [int(since_ts), int(end_ts), competition]
             query = """
-                SELECT hotkey, SUM(score) * 1.0 / COUNT(*), SUM(score), COUNT(*) FROM miner_records
+                SELECT hotkey, TOTAL(score), COUNT(*) FROM miner_records
                 WHERE ts >= ? AND ts < ? AND competition = ?
             """
             if validator_hotkey:
@@ -300,46 +395,73 @@ class ScoreStore:
             query += " GROUP BY hotkey"
             cur.execute(query, tuple(params))
             rows = cur.fetchall()
-            for row in rows:
-                hotkey, avg_score, total_score, count = row
-                avg_scores[hotkey] = float(avg_score or 0.0)
-                total_scores[hotkey] = float(total_score or 0.0)
-                counts[hotkey] = float(count or 0.0)
             cur.close()
-        return dict(avg_scores), dict(total_scores), dict(counts)
+        # GROUP BY never yields an empty group, so count is always >= 1.
+        total_scores = {hotkey: total for hotkey, total, _ in rows}
+        counts = {hotkey: float(count) for hotkey, _, count in rows}
+        avg_scores = {hotkey: total / count for hotkey, total, count in rows}
+        return avg_scores, total_scores, counts
 
     def records_in_window(
         self, validator: str, competition: str, since_ts: float, end_ts: float
     ) -> Dict[str, Dict[str, list]]:
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute(
-                """
-                SELECT hotkey, COUNT(*)
-                FROM miner_records
-                WHERE ts >= ? AND ts < ? AND competition = ? AND validator = ?
-                GROUP BY hotkey
-                """,
-                (int(since_ts), int(end_ts), competition, validator),
-            )
-            local_rows = cur.fetchall()
+        return self.records_in_ranges(validator, competition, [(since_ts, end_ts)])[0]
 
+    def records_in_ranges(
+        self,
+        validator: str,
+        competition: str,
+        ranges: Sequence[Tuple[float, float]],
+    ) -> List[Tuple[Dict[str, int], Dict[str, int]]]:
+        """Count games per hotkey for several ``[since_ts, end_ts)`` ranges at once.
+
+        Returns one ``(local_counts, global_counts)`` pair per range, where local
+        counts only include games recorded by ``validator``. All ranges are
+        counted in a single scan over their combined span.
+        """
+        bounds = [(int(since_ts), int(end_ts)) for since_ts, end_ts in ranges]
+        if not bounds:
+            return []
+        columns = []
+        params: list = []
+        for since_ts, end_ts in bounds:
+            columns.append(
+                "SUM(CASE WHEN ts >= ? AND ts < ? AND validator = ? THEN 1 ELSE 0 END)"
+            )
+            columns.append("SUM(CASE WHEN ts >= ? AND ts < ? THEN 1 ELSE 0 END)")
+            params.extend((since_ts, end_ts, validator, since_ts, end_ts))
+        params.extend(
+            (
+                min(since_ts for since_ts, _ in bounds),
+                max(end_ts for _, end_ts in bounds),
+                competition,
+            )
+        )
+        with self._reader() as conn:
+            cur = conn.cursor()
             cur.execute(
-                """
-                SELECT hotkey, COUNT(*)
+                f"""
+                SELECT hotkey, {", ".join(columns)}
                 FROM miner_records
                 WHERE ts >= ? AND ts < ? AND competition = ?
                 GROUP BY hotkey
                 """,
-                (int(since_ts), int(end_ts), competition),
+                params,
             )
-            global_rows = cur.fetchall()
+            rows = cur.fetchall()
             cur.close()
 
-        return (
-            {hotkey: int(count) for hotkey, count in local_rows},
-            {hotkey: int(count) for hotkey, count in global_rows},
-        )
+        results = []
+        for i in range(len(bounds)):
+            local_counts = {row[0]: int(row[1 + 2 * i]) for row in rows}
+            global_counts = {row[0]: int(row[2 + 2 * i]) for row in rows}
+            results.append(
+                (
+                    {hotkey: count for hotkey, count in local_counts.items() if count},
+                    {hotkey: count for hotkey, count in global_counts.items() if count},
+                )
+            )
+        return results
 
     def observer_records_in_window(
         self,
@@ -355,8 +477,8 @@ class ScoreStore:
         - Their hotkey is not one of the four main player roles (rs, ro, bs, bo) in ``scores_all``.
         """
 
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as conn:
+            cur = conn.cursor()
             cur.execute(
                 """
                 SELECT mr.hotkey, COUNT(*)
@@ -398,8 +520,8 @@ class ScoreStore:
 
         A "win" is any record with score > 0. A "loss" is score <= 0.
         """
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as conn:
+            cur = conn.cursor()
             cur.execute(
                 """
                 SELECT
@@ -427,8 +549,8 @@ class ScoreStore:
         return wins, losses
 
     def max_scores_all_id(self, validator_hotkey: Optional[str] = None) -> int:
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as conn:
+            cur = conn.cursor()
             if validator_hotkey:
                 cur.execute(
                     "SELECT MAX(id) FROM scores_all WHERE validator = ?",
@@ -445,8 +567,8 @@ class ScoreStore:
     def latest_scores_all_timestamp(
         self, validator_hotkey: Optional[str] = None
     ) -> int:
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as conn:
+            cur = conn.cursor()
             if validator_hotkey:
                 cur.execute(
                     "SELECT MAX(ended_at) FROM scores_all WHERE validator = ?",
@@ -479,8 +601,8 @@ class ScoreStore:
         competition: Optional[str] = None,
         validator_hotkey: Optional[str] = None,
     ) -> int:
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as conn:
+            cur = conn.cursor()
             params = [int(since_ts), int(end_ts)]
             query = (
                 "SELECT COUNT(*) FROM scores_all WHERE ended_at >= ? AND ended_at < ?"
@@ -514,6 +636,11 @@ class ScoreStore:
             cur.close()
         return int(count)
 
+    def checkpoint(self, mode: str = "PASSIVE") -> None:
+        """Copy committed WAL pages back into the database file."""
+        with self._lock:
+            self.conn.execute(f"PRAGMA wal_checkpoint({mode});")
+
     def mark_synced(self, room_id: str) -> None:
         with self._lock:
             cur = self.conn.cursor()
@@ -523,6 +650,16 @@ class ScoreStore:
             )
             cur.close()
 
+    async def _open_session(self) -> Tuple[aiohttp.ClientSession, bool]:
+        """Return ``(session, owned)``; the caller closes owned sessions.
+
+        With a ``session_factory`` the validator's pooled session is reused,
+        so score uploads and history syncs skip the TCP/TLS handshake.
+        """
+        if self.session_factory is not None:
+            return await self.session_factory(), False
+        return aiohttp.ClientSession(), True
+
     async def upload_score(
         self,
         room_id: str,
@@ -568,7 +705,10 @@ class ScoreStore:
                 score_value = 0.0
             clean_scores.append({"hotkey": hotkey, "score": score_value})
 
-        self._upsert_local_miner_scores(
+        # SQLite calls in the async paths run on a worker thread so they do
+        # not stall the event loop while the writer lock is contended.
+        await asyncio.to_thread(
+            self._upsert_local_miner_scores,
             room_id=room_id,
             competition=competition,
             scores=clean_scores,
@@ -578,7 +718,8 @@ class ScoreStore:
             bt.logging.warning("No backend URL configured for score syncing.")
             return True
 
-        async with aiohttp.ClientSession() as session:
+        session, close_session = await self._open_session()
+        try:
             participants = [
                 {"hotkey": row["hotkey"], "score": row["score"]} for row in clean_scores
             ]
@@ -596,7 +737,7 @@ class ScoreStore:
                     timeout=10,
                 ) as resp:
                     if resp.status in (200, 201, 202, 204):
-                        self.mark_synced(room_id)
+                        await asyncio.to_thread(self.mark_synced, room_id)
                     else:
                         text = await resp.text()
                         bt.logging.error(
@@ -612,6 +753,9 @@ class ScoreStore:
                 bt.logging.warning(
                     f"Post-upload score sync timed out after 600s for room {room_id}; continuing."
                 )
+        finally:
+            if close_session:
+                await session.close()
         return True
 
     async def sync_scores_all(
@@ -623,13 +767,15 @@ class ScoreStore:
 
         close_session = False
         if session is None:
-            session = aiohttp.ClientSession()
-            close_session = True
+            session, close_session = await self._open_session()
 
+        # Each page is written on a worker thread while the next one is
+        # being fetched; pages are still applied strictly in order.
+        upsert_task: Optional[asyncio.Task] = None
         try:
             headers = self.signer() if self.signer else {}
             params = {}
-            since_id = self.max_scores_all_id()
+            since_id = await asyncio.to_thread(self.max_scores_all_id)
             if since_id > 0:
                 since_id += 1
             params["since_id"] = since_id
@@ -684,12 +830,21 @@ class ScoreStore:
                         )
                         break
 
-                    self._upsert_scores_all(data)
+                    if upsert_task is not None:
+                        await upsert_task
+                    upsert_task = asyncio.create_task(
+                        asyncio.to_thread(self._upsert_scores_all, data)
+                    )
                     if (params["since_id"] + page_count) <= total_count:
                         bt.logging.info(
                             f"Synced Score: {params['since_id'] + page_count} / {total_count}"
                         )
                     if not has_more:
+                        # Every page must be stored before the sync counts as
+                        # done; a failed write lands in the except below.
+                        await upsert_task
+                        upsert_task = None
+                        await asyncio.to_thread(self.checkpoint)
                         bt.logging.info(
                             "Sync completed: "
                             f"{total_rows_fetched} row(s) fetched in {page_num} page(s). "
@@ -703,11 +858,21 @@ class ScoreStore:
                         )
                         break
                     params["since_id"] = next_since_id
+            if upsert_task is not None:
+                await upsert_task
+                upsert_task = None
             return total_rows_fetched
         except Exception as err:  # noqa: BLE001
             bt.logging.error(f"Exception refreshing scores_all: {err}")
             return 0
         finally:
+            # Only reached with a task still pending when the sync is already
+            # failing; let the in-flight write finish before returning.
+            if upsert_task is not None:
+                try:
+                    await upsert_task
+                except Exception as err:  # noqa: BLE001
+                    bt.logging.error(f"Exception storing scores_all page: {err}")
             if close_session:
                 await session.close()
 
@@ -747,17 +912,18 @@ class ScoreStore:
             return
         with self._lock:
             cur = self.conn.cursor()
-            cur.executemany(
-                """
-                INSERT INTO miner_records(validator, competition, hotkey, room_id, score, ts, synced_at)
-                VALUES(?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(room_id, hotkey) DO UPDATE SET
-                    score=excluded.score,
-                    ts=excluded.ts,
-                    synced_at=excluded.synced_at
-                """,
-                rows,
-            )
+            with self._transaction(cur):
+                cur.executemany(
+                    """
+                    INSERT INTO miner_records(validator, competition, hotkey, room_id, score, ts, synced_at)
+                    VALUES(?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(room_id, hotkey) DO UPDATE SET
+                        score=excluded.score,
+                        ts=excluded.ts,
+                        synced_at=excluded.synced_at
+                    """,
+                    rows,
+                )
             cur.close()
 
     def _upsert_scores_all(self, rows: Sequence[dict]) -> None:
@@ -772,6 +938,8 @@ class ScoreStore:
                 )
                 ended_at = parse_ts(row.get("ended_at")) or parse_ts(row.get("endedAt"))
                 competition = row.get("competition") or ""
+                room_id = str(row.get("room_id") or row.get("roomId") or "")
+                validator = str(row.get("validator") or "")
                 score_rs = float(row.get("score_rs") or row.get("scoreRs") or 0.0)
                 score_ro = float(row.get("score_ro") or row.get("scoreRo") or 0.0)
                 score_bs = float(row.get("score_bs") or row.get("scoreBs") or 0.0)
@@ -779,9 +947,9 @@ class ScoreStore:
                 mapped_rows.append(
                     (
                         int(row.get("id") or 0),
-                        str(row.get("room_id") or row.get("roomId") or ""),
+                        room_id,
                         competition,
-                        str(row.get("validator") or ""),
+                        validator,
                         str(row.get("rs") or ""),
                         str(row.get("ro") or ""),
                         str(row.get("bs") or ""),
@@ -794,11 +962,9 @@ class ScoreStore:
                         score_bs,
                         score_bo,
                         row.get("reason"),
-                        int(time.time()),
+                        synced_at,
                     )
                 )
-                room_id = str(row.get("room_id") or row.get("roomId") or "")
-                validator = str(row.get("validator") or "")
                 participants = row.get("participants") or []
                 score_map = {}
                 raw_scores = row.get("scores") or []
@@ -829,8 +995,11 @@ class ScoreStore:
                         "score_map": score_map,
                     }
                 )
-                default_scores = [score_rs, score_ro, score_bs, score_bo]
-                for idx, participant in enumerate(participants):
+                # Seats without a score_map entry fall back to rs/ro/bs/bo order.
+                default_scores = chain(
+                    (score_rs, score_ro, score_bs, score_bo), repeat(0.0)
+                )
+                for participant, default_score in zip(participants, default_scores):
                     participant_hotkey = ""
                     if isinstance(participant, str):
                         participant_hotkey = participant
@@ -839,18 +1008,13 @@ class ScoreStore:
                     participant_hotkey = participant_hotkey.strip()
                     if not participant_hotkey or participant_hotkey == validator:
                         continue
-                    if participant_hotkey in score_map:
-                        participant_score = score_map[participant_hotkey]
-                    elif idx < len(default_scores):
-                        participant_score = default_scores[idx]
-                    else:
-                        participant_score = 0.0
+                    participant_score = score_map.get(participant_hotkey, default_score)
                     miner_records.append(
                         (
                             validator,
                             competition,
                             participant_hotkey,
-                            str(row.get("room_id") or row.get("roomId") or ""),
+                            room_id,
                             float(participant_score),
                             int(ended_at or 0),
                             int(
@@ -866,44 +1030,45 @@ class ScoreStore:
 
         with self._lock:
             cur = self.conn.cursor()
-            cur.executemany(
-                """
-                INSERT INTO scores_all(
-                    id, room_id, competition, validator, rs, ro, bs, bo,
-                    winner, started_at, ended_at,
-                    score_rs, score_ro, score_bs, score_bo,
-                    reason, synced_at
-                ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                ON CONFLICT(room_id) DO UPDATE SET
-                    competition=excluded.competition,
-                    rs=excluded.rs,
-                    ro=excluded.ro,
-                    bs=excluded.bs,
-                    bo=excluded.bo,
-                    winner=excluded.winner,
-                    started_at=excluded.started_at,
-                    ended_at=excluded.ended_at,
-                    score_rs=excluded.score_rs,
-                    score_ro=excluded.score_ro,
-                    score_bs=excluded.score_bs,
-                    score_bo=excluded.score_bo,
-                    reason=excluded.reason,
-                    synced_at=excluded.synced_at
-                ;
-                """,
-                mapped_rows,
-            )
-            cur.executemany(
-                """
-                INSERT INTO miner_records(validator, competition, hotkey, room_id, score, ts, synced_at)
-                VALUES(?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(room_id, hotkey) DO UPDATE SET
-                    score=excluded.score,
-                    ts=excluded.ts,
-                    synced_at=excluded.synced_at
-                """,
-                miner_records,
-            )
+            with self._transaction(cur):
+                cur.executemany(
+                    """
+                    INSERT INTO scores_all(
+                        id, room_id, competition, validator, rs, ro, bs, bo,
+                        winner, started_at, ended_at,
+                        score_rs, score_ro, score_bs, score_bo,
+                        reason, synced_at
+                    ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                    ON CONFLICT(room_id) DO UPDATE SET
+                        competition=excluded.competition,
+                        rs=excluded.rs,
+                        ro=excluded.ro,
+                        bs=excluded.bs,
+                        bo=excluded.bo,
+                        winner=excluded.winner,
+                        started_at=excluded.started_at,
+                        ended_at=excluded.ended_at,
+                        score_rs=excluded.score_rs,
+                        score_ro=excluded.score_ro,
+                        score_bs=excluded.score_bs,
+                        score_bo=excluded.score_bo,
+                        reason=excluded.reason,
+                        synced_at=excluded.synced_at
+                    ;
+                    """,
+                    mapped_rows,
+                )
+                cur.executemany(
+                    """
+                    INSERT INTO miner_records(validator, competition, hotkey, room_id, score, ts, synced_at)
+                    VALUES(?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(room_id, hotkey) DO UPDATE SET
+                        score=excluded.score,
+                        ts=excluded.ts,
+                        synced_at=excluded.synced_at
+                    """,
+                    miner_records,
+                )
             cur.close()
         self._upsert_generic_scores_all(generic_rows)
 
@@ -984,6 +1149,14 @@ class ScoreStore:
                 )
 
     def close(self):
+        # Readers still borrowed now close their connection when released.
+        with self._read_pool_lock:
+            self._read_pool_closed = True
+            while True:
+                try:
+                    self._read_pool.get_nowait().close()
+                except queue.Empty:
+                    break
         with self._lock:
             if self._conn is not None:
                 try:
@@ -0,0 +1,206 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+
+from game.core import miner_selection
+from game.core.miner_selection import (
+    _counts_by_uid,
+    _keep_lexmin,
+    _uid_mask,
+    make_available_pool,
+)
+from game.plugins.codenames.game_types import Competition
+
+
+def test_counts_by_uid_defaults_missing_hotkeys_to_zero():
+    counts = _counts_by_uid(["a", "b", "c"], {"b": 4})
+
+    assert counts.tolist() == [0, 4, 0]
+
+
+def test_keep_lexmin_compares_counts_in_order():
+    idx = np.arange(5)
+    first = np.array([1, 0, 0, 0, 0])
+    second = np.array([0, 2, 1, 1, 1])
+    third = np.array([0, 0, 3, 2, 2])
+
+    assert _keep_lexmin(idx, first, second, third).tolist() == [3, 4]
+    assert _keep_lexmin(idx[:3], first, second, third).tolist() == [2]
+
+
+def test_make_available_pool_keeps_lowest_count_tier():
+    epoch_counts = np.array([0, 0, 0, 0, 1, 0])
+    local_counts = np.array([1, 0, 0, 0, 0, 0])
+    global_counts = np.array([0, 2, 1, 1, 0, 1])
+
+    pool = make_available_pool(
+        np.arange(6),
+        _uid_mask(6, [5]),
+        epoch_counts,
+        local_counts,
+        global_counts,
+    )
+
+    assert sorted(pool) == [2, 3]
+
+
+def test_make_available_pool_returns_empty_when_everything_excluded():
+    zeros = np.zeros(3, dtype=np.int64)
+
+    pool = make_available_pool(
+        np.arange(3), _uid_mask(3, [0, 1, 2]), zeros, zeros, zeros
+    )
+
+    assert pool == []
+
+
+def test_second_player_pool_drops_uids_far_above_median():
+    zeros = np.zeros(5, dtype=np.int64)
+    global_counts = np.array([0, 1, 2, 9, 1])
+
+    pool = make_available_pool(
+        np.arange(5),
+        _uid_mask(5, []),
+        zeros,
+        zeros,
+        global_counts,
+        second_player=True,
+    )
+
+    assert sorted(pool) == [0, 1, 2, 4]
+
+
+class _FakeValidator(SimpleNamespace):
+    # ttl_cache keys on the validator instance, like the real neuron.
+    __hash__ = object.__hash__
+
+
+def _choose_players_validator(stake):
+    n = len(stake)
+    hotkeys = [f"hotkey-{uid}" for uid in range(n)]
+    return _FakeValidator(
+        metagraph=SimpleNamespace(
+            uids=np.arange(n),
+            hotkeys=hotkeys,
+            S=np.asarray(stake, dtype=np.float64),
+        ),
+        config=SimpleNamespace(
+            netuid=1,
+            neuron=SimpleNamespace(minimum_stake_requirement=0.0),
+            blacklist=SimpleNamespace(minimum_stake_requirement=100.0),
+        ),
+        scoring_window_seconds=3600,
+        subtensor=SimpleNamespace(
+            get_subnet_info=lambda netuid: SimpleNamespace(blocks_since_epoch=0),
+            get_timestamp=lambda: SimpleNamespace(timestamp=lambda: 1_000_000.0),
+        ),
+        score_store=SimpleNamespace(
+            records_in_ranges=lambda validator, competition, ranges: [
+                ({}, {}) for _ in ranges
+            ],
+        ),
+        wallet=SimpleNamespace(hotkey=SimpleNamespace(ss58_address="validator")),
+    )
+
+
+def test_choose_players_skips_low_stake_and_unresponsive(monkeypatch):
+    validator = _choose_players_validator([-1.0, 1.0, 1.0, 1.0])
+
+    async def fake_check_endpoints(self, targon_endpoints, timeout=30):
+        return [uid for uid in targon_endpoints if uid != 1]
+
+    async def fake_fetch_active_miners(self, competition):
+        return []
+
+    async def fake_get_metadata(self, endpoint, hotkey):
+        return {"reasoning": "low"}
+
+    monkeypatch.setattr(
+        miner_selection,
+        "read_endpoints",
+        lambda self, competition, uids: {uid: f"wrk-{uid}" for uid in uids},
+    )
+    monkeypatch.setattr(miner_selection, "check_endpoints", fake_check_endpoints)
+    monkeypatch.setattr(
+        miner_selection, "fetch_active_miners", fake_fetch_active_miners
+    )
+    monkeypatch.setattr(miner_selection, "get_metadata", fake_get_metadata)
+
+    selected, observer_hotkeys, metadata = asyncio.run(
+        miner_selection.choose_players(validator, Competition.CODENAMES, k=2)
+    )
+
+    assert sorted(selected) == [2, 3]
+    assert set(observer_hotkeys) <= {"hotkey-1"}
+    assert metadata == {
+        uid: {"endpoint": f"wrk-{uid}", "reasoning": "low"} for uid in selected
+    }
+
+
+def test_median_matches_numpy_for_odd_and_even_sizes():
+    assert miner_selection._median(np.array([3, 1, 2])) == 2.0
+    assert miner_selection._median(np.array([4, 1, 3, 2])) == 2.5
+
+
+def test_choose_players_returns_early_without_endpoints(monkeypatch):
+    validator = _choose_players_validator([1.0, 1.0])
+
+    async def unexpected(*args, **kwargs):
+        raise AssertionError("no network calls expected without endpoints")
+
+    monkeypatch.setattr(
+        miner_selection, "read_endpoints", lambda self, competition, uids: {}
+    )
+    monkeypatch.setattr(miner_selection, "check_endpoints", unexpected)
+    monkeypatch.setattr(miner_selection, "fetch_active_miners", unexpected)
+
+    result = asyncio.run(
+        miner_selection.choose_players(validator, Competition.CODENAMES, k=2)
+    )
+
+    assert result == ([], [], {})
+
+
+def test_random_order_yields_every_uid_once():
+    pool = [3, 1, 4, 5, 9]
+
+    drawn = list(miner_selection._random_order(pool))
+
+    assert sorted(drawn) == [1, 3, 4, 5, 9]
+    assert pool == []
+
+
+def test_active_games_only_count_for_miners_with_stored_records(monkeypatch):
+    validator = _choose_players_validator([1.0, 1.0, 1.0])
+    stored = {"hotkey-1": 1, "hotkey-2": 1}
+    validator.score_store.records_in_ranges = lambda validator, competition, ranges: [
+        ({}, dict(stored)) for _ in ranges
+    ]
+
+    async def fake_check_endpoints(self, targon_endpoints, timeout=30):
+        return list(targon_endpoints)
+
+    async def fake_fetch_active_miners(self, competition):
+        # hotkey-0 has a game in progress but nothing stored yet.
+        return ["hotkey-0"]
+
+    async def fake_get_metadata(self, endpoint, hotkey):
+        return {}
+
+    monkeypatch.setattr(
+        miner_selection,
+        "read_endpoints",
+        lambda self, competition, uids: {uid: f"wrk-{uid}" for uid in uids},
+    )
+    monkeypatch.setattr(miner_selection, "check_endpoints", fake_check_endpoints)
+    monkeypatch.setattr(
+        miner_selection, "fetch_active_miners", fake_fetch_active_miners
+    )
+    monkeypatch.setattr(miner_selection, "get_metadata", fake_get_metadata)
+
+    for _ in range(5):
+        selected, _, _ = asyncio.run(
+            miner_selection.choose_players(validator, Competition.CODENAMES, k=1)
+        )
+        assert selected == [0]
@@ -0,0 +1,37 @@
+import asyncio
+import importlib
+from types import SimpleNamespace
+
+from game.plugins.codenames.game_types import Competition, GameState
+
+# game.validator re-exports the forward() coroutine under the module's name.
+forward = importlib.import_module("game.validator.forward")
+
+
+def test_queue_room_update_sends_snapshots_in_order(monkeypatch):
+    sent = []
+
+    async def fake_send_room_update(self, payload, roomId):
+        # Earlier updates take longer, so ordering relies on the chaining.
+        await asyncio.sleep(0.01 * (3 - payload["remainingRed"]))
+        sent.append((roomId, payload["remainingRed"]))
+
+    monkeypatch.setattr(forward, "_send_room_update", fake_send_room_update)
+    validator = SimpleNamespace(
+        wallet=SimpleNamespace(hotkey=SimpleNamespace(ss58_address="validator"))
+    )
+    game_state = GameState(competition=Competition.CODENAMES, participants=[])
+
+    async def play():
+        room_update = None
+        for remaining in (0, 1, 2):
+            game_state.remainingRed = remaining
+            room_update = forward.queue_room_update(
+                validator, game_state, "room-1", [], room_update
+            )
+        game_state.remainingRed = 99
+        await room_update
+
+    asyncio.run(play())
+
+    assert sent == [("room-1", 0), ("room-1", 1), ("room-1", 2)]
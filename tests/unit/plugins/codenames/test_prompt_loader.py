@@ -0,0 +1,51 @@
+import os
+
+from game.plugins.codenames import prompt_loader
+
+
+def test_load_prompt_invalidates_on_size_change_with_same_mtime(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompt_loader, "_PROMPTS_DIR", tmp_path)
+    prompt_loader.clear_prompt_cache()
+    prompt_file = tmp_path / "sample.txt"
+    prompt_file.write_text("first", encoding="utf-8")
+    original = prompt_file.stat()
+
+    assert prompt_loader.load_prompt("sample") == "first"
+
+    prompt_file.write_text("second version", encoding="utf-8")
+    os.utime(prompt_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+    assert prompt_loader.load_prompt("sample") == "second version"
+    prompt_loader.clear_prompt_cache()
+
+
+def test_load_prompt_keeps_cached_string_when_rewrite_is_identical(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(prompt_loader, "_PROMPTS_DIR", tmp_path)
+    prompt_loader.clear_prompt_cache()
+    prompt_file = tmp_path / "sample.txt"
+    prompt_file.write_text("same text", encoding="utf-8")
+    first = prompt_loader.load_prompt("sample")
+
+    stat = prompt_file.stat()
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert prompt_loader.load_prompt("sample") is first
+    prompt_loader.clear_prompt_cache()
+
+
+def test_role_prompt_is_rebuilt_only_when_a_part_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompt_loader, "_PROMPTS_DIR", tmp_path)
+    prompt_loader.clear_prompt_cache()
+    (tmp_path / "baseSysPrompt.txt").write_text("base", encoding="utf-8")
+    (tmp_path / "opSysPrompt.txt").write_text("op", encoding="utf-8")
+
+    first = prompt_loader.get_op_sys_prompt()
+    assert first == "base\n\nop"
+    assert prompt_loader.get_op_sys_prompt() is first
+
+    (tmp_path / "opSysPrompt.txt").write_text("operative", encoding="utf-8")
+
+    assert prompt_loader.get_op_sys_prompt() == "base\n\noperative"
+    prompt_loader.clear_prompt_cache()
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+from game.providers import targon_client
+
+
+def test_check_endpoints_probes_endpoints_concurrently(monkeypatch):
+    async def fake_check_endpoint(self, uid, endpoint):
+        await asyncio.sleep(0.2)
+        return uid != 2
+
+    monkeypatch.setenv("TARGON_API_KEY", "test-key")
+    monkeypatch.setattr(targon_client, "_check_endpoint", fake_check_endpoint)
+
+    start = time.monotonic()
+    responsive = asyncio.run(
+        targon_client.check_endpoints(
+            None, {uid: f"wrk-{uid}" for uid in range(5)}, timeout=5
+        )
+    )
+
+    assert responsive == [0, 1, 3, 4]
+    assert time.monotonic() - start < 0.6
+
+
+def test_check_endpoints_drops_timed_out_endpoints(monkeypatch):
+    async def fake_check_endpoint(self, uid, endpoint):
+        await asyncio.sleep(1 if uid == 0 else 0)
+        return True
+
+    monkeypatch.setenv("TARGON_API_KEY", "test-key")
+    monkeypatch.setattr(targon_client, "_check_endpoint", fake_check_endpoint)
+
+    responsive = asyncio.run(
+        targon_client.check_endpoints(None, {0: "wrk-0", 1: "wrk-1"}, timeout=0.1)
+    )
+
+    assert responsive == [1]
+
+
+def test_check_endpoints_caps_checks_in_flight(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_check_endpoint(self, uid, endpoint):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    monkeypatch.setenv("TARGON_API_KEY", "test-key")
+    monkeypatch.setattr(targon_client, "_check_endpoint", fake_check_endpoint)
+
+    responsive = asyncio.run(
+        targon_client.check_endpoints(
+            None,
+            {uid: f"wrk-{uid}" for uid in range(10)},
+            timeout=5,
+            max_concurrency=3,
+        )
+    )
+
+    assert responsive == list(range(10))
+    assert peak == 3
+
+
+def test_check_endpoints_drops_cancelled_probes(monkeypatch):
+    async def fake_check_endpoint(self, uid, endpoint):
+        if uid == 0:
+            raise asyncio.CancelledError()
+        return True
+
+    monkeypatch.setenv("TARGON_API_KEY", "test-key")
+    monkeypatch.setattr(targon_client, "_check_endpoint", fake_check_endpoint)
+
+    responsive = asyncio.run(
+        targon_client.check_endpoints(None, {0: "wrk-0", 1: "wrk-1"}, timeout=5)
+    )
+
+    assert responsive == [1]
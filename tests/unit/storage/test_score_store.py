@@ -0,0 +1,267 @@
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from game.validator import score_store
+from game.validator.score_store import ScoreStore
+
+
+def test_records_in_ranges_counts_each_range_separately(tmp_path):
+    store = ScoreStore(
+        str(tmp_path / "scores.db"),
+        backend_url="",
+        fetch_url=None,
+        signer=lambda: {"X-Validator-Hotkey": "validator-a"},
+    )
+    store.init()
+    store.conn.executemany(
+        """
+        INSERT INTO miner_records(validator, competition, hotkey, room_id, score, ts, synced_at)
+        VALUES(?, ?, ?, ?, ?, ?, 0)
+        """,
+        [
+            ("validator-a", "codenames", "miner-1", "room-1", 1.0, 100),
+            ("validator-b", "codenames", "miner-1", "room-2", 1.0, 150),
+            ("validator-a", "codenames", "miner-2", "room-3", 1.0, 250),
+            ("validator-a", "twentyq", "miner-2", "room-4", 1.0, 260),
+        ],
+    )
+
+    ranges = [(0, 200), (120, 300)]
+    combined = store.records_in_ranges("validator-a", "codenames", ranges)
+
+    assert combined == [
+        ({"miner-1": 1}, {"miner-1": 2}),
+        ({"miner-2": 1}, {"miner-1": 1, "miner-2": 1}),
+    ]
+
+
+def test_open_session_reuses_factory_session(tmp_path):
+    shared = object()
+
+    async def session_factory():
+        return shared
+
+    store = ScoreStore(
+        str(tmp_path / "scores.db"),
+        backend_url="",
+        session_factory=session_factory,
+    )
+
+    session, owned = asyncio.run(store._open_session())
+
+    assert session is shared
+    assert owned is False
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self, content_type=None):
+        return self._payload
+
+
+class _PagedSession:
+    def __init__(self, pages):
+        self._pages = list(pages)
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        return _FakeResponse(self._pages.pop(0))
+
+
+def _scores_all_row(row_id):
+    return {
+        "id": row_id,
+        "room_id": f"room-{row_id}",
+        "competition": "codenames",
+        "validator": "validator-a",
+        "rs": "miner-1",
+        "ro": "miner-2",
+        "bs": "miner-3",
+        "bo": "miner-4",
+        "started_at": 100,
+        "ended_at": 120,
+        "score_rs": 1.0,
+        "participants": ["miner-1", "miner-2", "miner-3", "miner-4"],
+    }
+
+
+def test_sync_scores_all_stores_every_page(tmp_path):
+    session = _PagedSession(
+        [
+            {
+                "data": [_scores_all_row(1), _scores_all_row(2)],
+                "meta": {"count": 2, "total": 3, "has_more": True, "next_since_id": 3},
+            },
+            {
+                "data": [_scores_all_row(3)],
+                "meta": {"count": 1, "total": 3, "has_more": False},
+            },
+        ]
+    )
+
+    async def session_factory():
+        return session
+
+    store = ScoreStore(
+        str(tmp_path / "scores.db"),
+        backend_url="",
+        fetch_url="http://backend/sync",
+        session_factory=session_factory,
+    )
+    store.init()
+
+    fetched = asyncio.run(store.sync_scores_all())
+
+    assert fetched == 3
+    assert store.max_scores_all_id() == 3
+
+
+def test_window_reads_do_not_wait_for_the_writer_lock(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), backend_url="")
+    store.init()
+    held = threading.Event()
+    release = threading.Event()
+    timed_out = []
+
+    def writer():
+        with store._lock:
+            held.set()
+            timed_out.append(not release.wait(5))
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    held.wait(5)
+    try:
+        assert store.max_scores_all_id() == 0
+        assert store.games_in_window(0, 1_000, "codenames") == 0
+    finally:
+        release.set()
+        thread.join()
+
+    assert timed_out == [False]
+
+
+def test_transaction_rolls_back_after_failed_commit(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), backend_url="")
+    store.init()
+
+    class _FailingCommitCursor:
+        def __init__(self, cur):
+            self._cur = cur
+
+        def execute(self, sql, *args):
+            if sql == "COMMIT":
+                raise sqlite3.OperationalError("database is locked")
+            return self._cur.execute(sql, *args)
+
+    cur = store.conn.cursor()
+    with pytest.raises(sqlite3.OperationalError):
+        with store._transaction(_FailingCommitCursor(cur)):
+            cur.execute("DELETE FROM scores")
+
+    assert not store.conn.in_transaction
+    with store._transaction(cur):
+        cur.execute("DELETE FROM scores")
+    cur.close()
+
+
+def test_sync_scores_all_reports_failure_when_a_page_write_fails(tmp_path):
+    session = _PagedSession(
+        [
+            {
+                "data": [_scores_all_row(1)],
+                "meta": {"count": 1, "total": 1, "has_more": False},
+            },
+        ]
+    )
+
+    async def session_factory():
+        return session
+
+    store = ScoreStore(
+        str(tmp_path / "scores.db"),
+        backend_url="",
+        fetch_url="http://backend/sync",
+        session_factory=session_factory,
+    )
+    store.init()
+    checkpoints = []
+
+    def failing_upsert(rows):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    store._upsert_scores_all = failing_upsert
+    store.checkpoint = lambda mode="PASSIVE": checkpoints.append(mode)
+
+    assert asyncio.run(store.sync_scores_all()) == 0
+    assert checkpoints == []
+
+
+def test_pending_returns_every_unsynced_row_unless_limited(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), backend_url="")
+    store.init()
+    for i in range(3):
+        store.record_game(
+            room_id=f"room-{i}",
+            competition="codenames",
+            rs="rs",
+            ro="ro",
+            bs="bs",
+            bo="bo",
+            winner="red",
+            started_at=i,
+            ended_at=i,
+            score_rs=1.0,
+            score_ro=1.0,
+            score_bs=0.0,
+            score_bo=0.0,
+            reason="completed",
+        )
+
+    assert [row["room_id"] for row in store.pending()] == [
+        "room-0",
+        "room-1",
+        "room-2",
+    ]
+    assert [row["room_id"] for row in store.pending(limit=2)] == ["room-0", "room-1"]
+
+
+def test_reader_borrowed_during_close_is_closed_on_release(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), backend_url="")
+    store.init()
+
+    with store._reader() as conn:
+        store.close()
+
+    assert store._read_pool.empty()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_read_pool_keeps_at_most_pool_size_idle_connections(tmp_path, monkeypatch):
+    monkeypatch.setattr(score_store, "READ_POOL_SIZE", 1)
+    store = ScoreStore(str(tmp_path / "scores.db"), backend_url="")
+    store.init()
+
+    with store._reader() as first:
+        with store._reader() as second:
+            pass
+
+    # second went back to the pool first; first found the pool full.
+    assert store._read_pool.qsize() == 1
+    second.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+    store.close()